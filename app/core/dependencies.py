@@ -1,18 +1,28 @@
-from fastapi import Depends, HTTPException, status
+from functools import lru_cache
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.employees import Employee
 from app.core.security import verify_access_token
 
 
 def get_current_employee(
+    request: Request,
     token_payload: dict = Depends(verify_access_token),
     db: Session = Depends(get_db)
 ) -> Employee:
     """
     Dependency to get the current authenticated employee from the database.
     Validates the bearer token and returns the Employee object.
+    The loaded employee is cached on request.state so that every dependency
+    in the same request (e.g. require_role) reuses it instead of re-querying.
     """
+    cached_employee = getattr(request.state, "current_user", None)
+    if cached_employee is not None:
+        return cached_employee
+    
     emp_id = token_payload.get("sub")
     
     # Query the employee from database
@@ -24,6 +34,7 @@ def get_current_employee(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    request.state.current_user = employee
     return employee
 
 
@@ -31,13 +42,75 @@ def require_role(allowed_roles: list):
     """
     Dependency factory to check if employee has required role.
     Usage: Depends(require_role(["admin", "manager"]))
+    The same role list always returns the same checker, so FastAPI's per-request
+    dependency cache runs each distinct check only once per request.
     """
+    return _build_role_checker(tuple(allowed_roles))
+
+
+@lru_cache(maxsize=None)
+def _build_role_checker(allowed_roles: tuple):
+    allowed = frozenset(allowed_roles)
+    detail = f"Access denied. Required role: {', '.join(allowed_roles)}"
+    
     def role_checker(current_employee: Employee = Depends(get_current_employee)) -> Employee:
-        if current_employee.role not in allowed_roles:
+        if current_employee.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required role: {', '.join(allowed_roles)}"
+                detail=detail
             )
         return current_employee
     return role_checker
 
+
+async def get_current_employee_async(
+    request: Request,
+    token_payload: dict = Depends(verify_access_token),
+    db: AsyncSession = Depends(get_async_db)
+) -> Employee:
+    """
+    Async version of get_current_employee for endpoints using AsyncSession.
+    Loads the employee through the request's AsyncSession so the endpoint
+    does not also check out a sync connection just for authentication.
+    """
+    cached_employee = getattr(request.state, "current_user", None)
+    if cached_employee is not None:
+        return cached_employee
+    
+    emp_id = token_payload.get("sub")
+    
+    # Query the employee from database
+    result = await db.execute(select(Employee).where(Employee.emp_id == int(emp_id)))
+    employee = result.scalar_one_or_none()
+    if not employee:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Employee not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    request.state.current_user = employee
+    return employee
+
+
+def require_role_async(allowed_roles: list):
+    """
+    Async version of require_role, backed by get_current_employee_async.
+    Usage: Depends(require_role_async(["admin", "manager"]))
+    """
+    return _build_role_checker_async(tuple(allowed_roles))
+
+
+@lru_cache(maxsize=None)
+def _build_role_checker_async(allowed_roles: tuple):
+    allowed = frozenset(allowed_roles)
+    detail = f"Access denied. Required role: {', '.join(allowed_roles)}"
+    
+    async def role_checker(current_employee: Employee = Depends(get_current_employee_async)) -> Employee:
+        if current_employee.role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+            )
+        return current_employee
+    return role_checker
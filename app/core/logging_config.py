@@ -0,0 +1,28 @@
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = "%(levelname)s:%(name)s:%(message)s"
+
+
+def setup_logging() -> QueueListener:
+    """
+    Route all logging through an in-memory queue so request handlers never block on stderr
+
+    The root logger only gets a QueueHandler; the returned QueueListener owns the real
+    StreamHandler and writes records from its own thread once started.
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(LOG_LEVEL)
+
+    return QueueListener(log_queue, stream_handler, respect_handler_level=True)
@@ -38,11 +38,6 @@ def decode_token(token: str) -> Optional[dict]:
         return None
 
 
-def is_refresh_token(token: str) -> bool:
-    payload = decode_token(token)
-    return bool(payload and payload.get("type") == "refresh")
-
-
 def verify_access_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     """
     Dependency to verify the bearer token and extract payload.
@@ -1,5 +1,6 @@
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -17,7 +18,9 @@ POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5432")
 POSTGRES_DB = os.getenv("POSTGRES_DB", "supermarket_db")
 
 # Create PostgreSQL database URL
-SQLALCHEMY_DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+SQLALCHEMY_DATABASE_URL = f"postgresql+psycopg2://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+# Same database through the asyncpg driver, used by async endpoints
+ASYNC_SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
 # Create database engine with optimized pool settings for production
 engine = create_engine(
@@ -34,6 +37,21 @@ engine = create_engine(
     }
 )
 
+# Async engine with the same pool settings (asyncpg takes its timeouts differently)
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    pool_pre_ping=True,
+    echo=False,
+    pool_size=10,
+    max_overflow=20,
+    pool_recycle=3600,
+    pool_timeout=30,
+    connect_args={
+        "timeout": 10,  # 10 second connection timeout
+        "server_settings": {"statement_timeout": "30000"}  # 30 second query timeout
+    }
+)
+
 # Create declarative base
 Base = declarative_base()
 
@@ -48,3 +66,13 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Create AsyncSessionLocal class
+# expire_on_commit=False so objects can still be read after commit without lazy IO
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# Dependency for async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
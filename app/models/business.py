@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String, Text, LargeBinary
+from sqlalchemy.orm import column_property, deferred
 from app.database import Base
 
 class Business(Base):
@@ -21,5 +22,8 @@ class Business(Base):
     bank_account_number = Column(String(50), nullable=True)
     ifsc_code = Column(String(20), nullable=True)
     upi_id = Column(String(100), nullable=True)
-    logo_data = Column(LargeBinary, nullable=True)  # Store logo image as binary
+    logo_data = deferred(Column(LargeBinary, nullable=True))  # Store logo image as binary, loaded only when accessed
     logo_content_type = Column(String(50), nullable=True)  # Store MIME type
+    
+    # Computed in the SELECT so reading a business never pulls the logo bytes
+    has_logo = column_property(logo_data.expression.isnot(None))
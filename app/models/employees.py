@@ -1,3 +1,4 @@
+from functools import cached_property
 from sqlalchemy import Column, Integer, String, JSON, Sequence, ForeignKey
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -35,7 +36,7 @@ class Employee(Base):
     country = Column(String(100), nullable=True)
     role = Column(String(50), nullable=False, default="employee")
     joining_date = Column(String(10), nullable=True)  # Stored as dd/mm/yyyy
-    custom_fields = Column(JSON, nullable=True)  # Array of {labelname: labelvalue}
+    custom_fields = Column(JSON, nullable=True)  # {labelname: labelvalue}; older rows hold an array of single-pair objects
     hashed_password = Column(String(255), nullable=False)
     avatar_url = Column(String(500), nullable=True)  # Avatar image URL from GCS
     thumbnail_url = Column(String(500), nullable=True)  # Thumbnail URL from GCS
@@ -47,3 +48,8 @@ class Employee(Base):
     
     # Relationship to custom labels
     labels = relationship("EmployeeLabel", back_populates="employee", cascade="all, delete-orphan")
+    
+    @cached_property
+    def business_key(self) -> str:
+        """business_id as the string key used by business-scoped tables, computed once per instance"""
+        return str(self.business_id)
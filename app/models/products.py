@@ -1,11 +1,30 @@
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, BigInteger, JSON, ARRAY, LargeBinary
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, BigInteger, JSON, ARRAY, LargeBinary, Computed, Index, DDL, event
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY, TSVECTOR
 
 from app.database import Base
 
+# Expression behind the generated search_vector column; must stay identical to the
+# one in migrate_product_indexes.py so the GIN index is used by search_products
+SEARCH_VECTOR_EXPRESSION = (
+    "to_tsvector('simple', "
+    "coalesce(productname, '') || ' ' || coalesce(productid, '') || ' ' || "
+    "coalesce(barcode, '') || ' ' || coalesce(sku, ''))"
+)
+
 class Products(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        # Per-tenant point lookups filter on business_id and id together
+        Index("products_business_id_id", "business_id", "id"),
+        Index("products_search_vector_gin", "search_vector", postgresql_using="gin"),
+        # Trigram indexes so ILIKE '%fragment%' searches can use an index
+        Index("products_productname_trgm", "productname", postgresql_using="gin", postgresql_ops={"productname": "gin_trgm_ops"}),
+        Index("products_productid_trgm", "productid", postgresql_using="gin", postgresql_ops={"productid": "gin_trgm_ops"}),
+        Index("products_barcode_trgm", "barcode", postgresql_using="gin", postgresql_ops={"barcode": "gin_trgm_ops"}),
+        Index("products_sku_trgm", "sku", postgresql_using="gin", postgresql_ops={"sku": "gin_trgm_ops"}),
+    )
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     business_id = Column(String(50), nullable=False, index=True)  # Links product to business
@@ -13,7 +32,7 @@ class Products(Base):
     # Product Identification
     productid = Column(String(100), unique=True, index=True, nullable=True)  # Auto-generated as PRD{id}
     productname = Column(String(500), nullable=False)
-    barcode = Column(String(100), nullable=False, index=True)
+    barcode = Column(String(100), unique=True, index=True, nullable=False)
     sku = Column(String(100), unique=True, index=True, nullable=True)
     
     # Product Details
@@ -50,3 +69,14 @@ class Products(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     updated_by = Column(String(50), nullable=True)
+    
+    # Full-text search - generated by Postgres, deferred so normal selects don't load it
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True))
+
+
+# gin_trgm_ops needs the pg_trgm extension before the products table indexes are created
+event.listen(
+    Products.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
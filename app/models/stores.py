@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -26,4 +26,19 @@ class Store(Base):
     # Composite unique constraint: store_name must be unique within a business
     __table_args__ = (
         UniqueConstraint('business_id', 'store_name', name='uq_business_store_name'),
+        # Keyset pagination of a business's stores in store_sequence order
+        Index('ix_store_biz_seq', 'business_id', 'store_sequence', 'id'),
     )
+
+
+class BusinessStoreCounter(Base):
+    """
+    Last store_sequence handed out per business
+    
+    create_store bumps this row with a single upsert in the same transaction as the
+    store INSERT, so concurrent creates get distinct sequences without counting stores.
+    """
+    __tablename__ = "business_store_counters"
+
+    business_id = Column(String(100), ForeignKey("business.business_id", ondelete="CASCADE"), primary_key=True)
+    last_sequence = Column(Integer, nullable=False, default=0)
@@ -13,7 +13,6 @@ from app.schemas.business import BusinessCreate, BusinessResponse, BusinessUpdat
 from app.core.dependencies import get_current_employee, require_role
 
 router = APIRouter(tags=["business"])
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def generate_business_id(db: Session) -> str:
@@ -54,30 +53,30 @@ async def create_business(
             )
         
         # Check if business details already exist for this user's business_id
-        user_business_id = str(current_user.business_id)
-        existing = db.query(Business).filter(Business.business_id == user_business_id).first()
+        user_business_id = current_user.business_key
+        existing = db.query(Business.business_id).filter(Business.business_id == user_business_id).first()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Business details already exist for your account. Please update the existing business instead of creating a new one."
             )
         
-        logger.info(f"Owner {current_user.name} ({current_user.email}) is creating business details for business_id: {user_business_id}")
+        logger.info("Owner %s (%s) is creating business details for business_id: %s", current_user.name, current_user.email, user_business_id)
         
         # Create business with user's business_id
-        db_business = Business(**business_data.dict(), business_id=user_business_id)
+        db_business = Business(**business_data.model_dump(), business_id=user_business_id)
         db.add(db_business)
         db.commit()
         db.refresh(db_business)
         
-        logger.info(f"Business created successfully: {db_business.business_name} (ID: {user_business_id})")
+        logger.info("Business created successfully: %s (ID: %s)", db_business.business_name, user_business_id)
         return db_business
     
     except HTTPException:
         raise
     except IntegrityError as e:
         db.rollback()
-        logger.error(f"Database integrity error while creating business: {str(e)}")
+        logger.error("Database integrity error while creating business: %s", e)
         
         # Check for specific constraint violations
         error_msg = str(e.orig).lower()
@@ -98,14 +97,14 @@ async def create_business(
             )
     except ValueError as e:
         db.rollback()
-        logger.error(f"Validation error while creating business: {str(e)}")
+        logger.error("Validation error while creating business: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid data provided: {str(e)}"
         )
     except Exception as e:
         db.rollback()
-        logger.error(f"Unexpected error creating business: {str(e)}", exc_info=True)
+        logger.error("Unexpected error creating business: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while creating the business. Please try again or contact support if the problem persists."
@@ -118,27 +117,24 @@ async def get_business(
 ):
     """Get business details - all authenticated users can view their business"""
     try:
-        logger.info(f"Fetching business for user: {current_user.name}, emp_id: {current_user.emp_id}, business_id: {current_user.business_id}")
-        user_business_id = str(current_user.business_id)
-        logger.info(f"Looking for business with business_id: {user_business_id}")
+        logger.info("Fetching business for user: %s, emp_id: %s, business_id: %s", current_user.name, current_user.emp_id, current_user.business_id)
+        user_business_id = current_user.business_key
+        logger.info("Looking for business with business_id: %s", user_business_id)
         business = db.query(Business).filter(Business.business_id == user_business_id).first()
         if not business:
-            logger.warning(f"No business found for business_id: {user_business_id}")
+            logger.warning("No business found for business_id: %s", user_business_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No business details found for your account. Please create your business profile first to get started."
             )
         
-        logger.info(f"Found business: {business.business_name} (ID: {business.business_id})")
-        # Create response with has_logo indicator
-        response_data = BusinessResponse.from_orm(business)
-        response_data.has_logo = business.logo_data is not None
-        return response_data
+        logger.info("Found business: %s (ID: %s)", business.business_name, business.business_id)
+        return business
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error fetching business for user {current_user.emp_id if current_user else 'unknown'}: {str(e)}", exc_info=True)
+        logger.error("Unexpected error fetching business for user %s: %s", current_user.emp_id if current_user else 'unknown', e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while loading business details. Please refresh the page or contact support."
@@ -152,7 +148,7 @@ async def update_business(
 ):
     """Update business details - owner and admin can update their business"""
     try:
-        user_business_id = str(current_user.business_id)
+        user_business_id = current_user.business_key
         business = db.query(Business).filter(Business.business_id == user_business_id).first()
         if not business:
             raise HTTPException(
@@ -160,10 +156,10 @@ async def update_business(
                 detail="No business found for your account. Please create business details first."
             )
         
-        logger.info(f"User {current_user.name} ({current_user.email}) is updating business details")
+        logger.info("User %s (%s) is updating business details", current_user.name, current_user.email)
         
         # Update only provided fields
-        update_data = business_data.dict(exclude_unset=True)
+        update_data = business_data.model_dump(exclude_unset=True)
         
         # Validate that at least one field is provided
         if not update_data:
@@ -203,28 +199,28 @@ async def update_business(
         db.commit()
         db.refresh(business)
         
-        logger.info(f"Business details updated successfully for: {business.business_name}")
+        logger.info("Business details updated successfully for: %s", business.business_name)
         return business
     
     except HTTPException:
         raise
     except IntegrityError as e:
         db.rollback()
-        logger.error(f"Database integrity error while updating business: {str(e)}")
+        logger.error("Database integrity error while updating business: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Update failed due to duplicate data. Please check your email and other unique fields."
         )
     except ValueError as e:
         db.rollback()
-        logger.error(f"Validation error while updating business: {str(e)}")
+        logger.error("Validation error while updating business: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid data provided: {str(e)}"
         )
     except Exception as e:
         db.rollback()
-        logger.error(f"Unexpected error updating business: {str(e)}", exc_info=True)
+        logger.error("Unexpected error updating business: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while updating business details. Please try again or contact support."
@@ -270,7 +266,7 @@ async def upload_logo(
             )
         
         # Get business record for current user
-        user_business_id = str(current_user.business_id)
+        user_business_id = current_user.business_key
         business = db.query(Business).filter(Business.business_id == user_business_id).first()
         if not business:
             raise HTTPException(
@@ -285,14 +281,14 @@ async def upload_logo(
         business.logo_content_type = file.content_type
         db.commit()
         
-        logger.info(f"Logo uploaded successfully for business: {business.business_name}")
+        logger.info("Logo uploaded successfully for business: %s", business.business_name)
         return {"message": "Logo uploaded successfully", "file_size_mb": round(file_size_mb, 2)}
     
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"Unexpected error uploading logo: {str(e)}", exc_info=True)
+        logger.error("Unexpected error uploading logo: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while uploading the logo. Please try again with a different image or contact support."
@@ -305,8 +301,10 @@ async def get_logo(
 ):
     """Get business logo - authenticated users can view their business logo"""
     try:
-        user_business_id = str(current_user.business_id)
-        business = db.query(Business).filter(Business.business_id == user_business_id).first()
+        user_business_id = current_user.business_key
+        business = db.query(Business.logo_data, Business.logo_content_type).filter(
+            Business.business_id == user_business_id
+        ).first()
         if not business:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -328,7 +326,7 @@ async def get_logo(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error fetching logo: {str(e)}", exc_info=True)
+        logger.error("Unexpected error fetching logo: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while loading the logo. Please try again."
@@ -1,6 +1,7 @@
 import logging
 from typing import List
 from fastapi import APIRouter, Depends, status, HTTPException
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, DatabaseError, OperationalError
 
@@ -11,7 +12,6 @@ from app.schemas.categories import CategoryCreate, CategoryResponse, CategoryUpd
 from app.core.dependencies import get_current_employee, require_role
 
 router = APIRouter(tags=["categories"])
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -86,23 +86,23 @@ async def get_all_categories(
             logger.info("No categories found in database")
             return []
         
-        logger.info(f"Successfully retrieved {len(categories)} categories")
+        logger.info("Successfully retrieved %d categories", len(categories))
         return categories
     
     except OperationalError as e:
-        logger.error(f"Database connection error: {str(e)}")
+        logger.error("Database connection error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=parse_exception_to_error_detail(e)
         )
     except DatabaseError as e:
-        logger.error(f"Database error: {str(e)}")
+        logger.error("Database error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=parse_exception_to_error_detail(e)
         )
     except Exception as e:
-        logger.error(f"Unexpected error fetching categories: {str(e)}")
+        logger.error("Unexpected error fetching categories: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=parse_exception_to_error_detail(e)
@@ -135,11 +135,11 @@ async def get_category(
         HTTPException: If category not found
     """
     try:
-        logger.info(f"Fetching category with ID: {category_id}")
+        logger.info("Fetching category with ID: %s", category_id)
         category = db.query(Category).filter(Category.id == category_id).first()
         
         if not category:
-            logger.warning(f"Category with ID {category_id} not found")
+            logger.warning("Category with ID %s not found", category_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -149,13 +149,13 @@ async def get_category(
                 }
             )
         
-        logger.info(f"Successfully retrieved category: {category.name}")
+        logger.info("Successfully retrieved category: %s", category.name)
         return category
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error fetching category: {str(e)}")
+        logger.error("Unexpected error fetching category: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=parse_exception_to_error_detail(e)
@@ -190,15 +190,15 @@ async def create_category(
         HTTPException: If category already exists or validation fails
     """
     try:
-        logger.info(f"Creating new category: {category_data.name}")
+        logger.info("Creating new category: %s", category_data.name)
         
         # Check if category already exists
-        existing_category = db.query(Category).filter(
-            Category.name.ilike(category_data.name)
-        ).first()
+        existing_category = db.query(
+            exists().where(Category.name.ilike(category_data.name))
+        ).scalar()
         
         if existing_category:
-            logger.warning(f"Category already exists: {category_data.name}")
+            logger.warning("Category already exists: %s", category_data.name)
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail={
@@ -220,21 +220,21 @@ async def create_category(
         db.commit()
         db.refresh(new_category)
         
-        logger.info(f"Successfully created category: {new_category.name} (ID: {new_category.id})")
+        logger.info("Successfully created category: %s (ID: %s)", new_category.name, new_category.id)
         return new_category
     
     except HTTPException:
         raise
     except IntegrityError as e:
         db.rollback()
-        logger.error(f"Integrity error creating category: {str(e)}")
+        logger.error("Integrity error creating category: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=parse_exception_to_error_detail(e)
         )
     except Exception as e:
         db.rollback()
-        logger.error(f"Unexpected error creating category: {str(e)}")
+        logger.error("Unexpected error creating category: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=parse_exception_to_error_detail(e)
@@ -271,12 +271,12 @@ async def update_category(
         HTTPException: If category not found or validation fails
     """
     try:
-        logger.info(f"Updating category with ID: {category_id}")
+        logger.info("Updating category with ID: %s", category_id)
         
         category = db.query(Category).filter(Category.id == category_id).first()
         
         if not category:
-            logger.warning(f"Category with ID {category_id} not found")
+            logger.warning("Category with ID %s not found", category_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -288,11 +288,11 @@ async def update_category(
         
         # Check for duplicate name if being updated
         if category_data.name and category_data.name != category.name:
-            existing = db.query(Category).filter(
-                Category.name.ilike(category_data.name)
-            ).first()
+            existing = db.query(
+                exists().where(Category.name.ilike(category_data.name))
+            ).scalar()
             if existing:
-                logger.warning(f"Category name already exists: {category_data.name}")
+                logger.warning("Category name already exists: %s", category_data.name)
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail={
@@ -312,21 +312,21 @@ async def update_category(
         db.commit()
         db.refresh(category)
         
-        logger.info(f"Successfully updated category: {category.name} (ID: {category.id})")
+        logger.info("Successfully updated category: %s (ID: %s)", category.name, category.id)
         return category
     
     except HTTPException:
         raise
     except IntegrityError as e:
         db.rollback()
-        logger.error(f"Integrity error updating category: {str(e)}")
+        logger.error("Integrity error updating category: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=parse_exception_to_error_detail(e)
         )
     except Exception as e:
         db.rollback()
-        logger.error(f"Unexpected error updating category: {str(e)}")
+        logger.error("Unexpected error updating category: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=parse_exception_to_error_detail(e)
@@ -360,12 +360,12 @@ async def delete_category(
         HTTPException: If category not found
     """
     try:
-        logger.info(f"Deleting category with ID: {category_id}")
+        logger.info("Deleting category with ID: %s", category_id)
         
         category = db.query(Category).filter(Category.id == category_id).first()
         
         if not category:
-            logger.warning(f"Category with ID {category_id} not found")
+            logger.warning("Category with ID %s not found", category_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -378,7 +378,7 @@ async def delete_category(
         db.delete(category)
         db.commit()
         
-        logger.info(f"Successfully deleted category with ID: {category_id}")
+        logger.info("Successfully deleted category with ID: %s", category_id)
         return {
             "message": f"Category '{category.name}' deleted successfully",
             "id": category_id
@@ -388,7 +388,7 @@ async def delete_category(
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"Unexpected error deleting category: {str(e)}")
+        logger.error("Unexpected error deleting category: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=parse_exception_to_error_detail(e)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
@@ -13,7 +14,6 @@ from app.schemas.custom_labels import (
 from app.core.dependencies import get_current_employee, require_role
 
 router = APIRouter()
-logging.basicConfig(level=logging.INFO)
 
 
 @router.post("/custom-labels", response_model=CustomLabelSchema, status_code=status.HTTP_201_CREATED)
@@ -27,18 +27,17 @@ def create_custom_label(
     Only owner, admin, or manager can create custom labels.
     """
     # Check if label already exists for this business and type (case-insensitive)
-    existing_labels = db.query(CustomLabel).filter(
+    existing_label_id = db.query(CustomLabel.id).filter(
         CustomLabel.business_id == current_employee.business_id,
-        CustomLabel.label_type == label_data.label_type
-    ).all()
+        CustomLabel.label_type == label_data.label_type,
+        func.lower(CustomLabel.label_name) == label_data.label_name.lower()
+    ).first()
     
-    # Case-insensitive name check
-    for existing in existing_labels:
-        if existing.label_name.lower() == label_data.label_name.lower():
-            raise HTTPException(
-                status_code=400,
-                detail="Duplicate label names not allowed. A label with this name already exists (case-insensitive)."
-            )
+    if existing_label_id:
+        raise HTTPException(
+            status_code=400,
+            detail="Duplicate label names not allowed. A label with this name already exists (case-insensitive)."
+        )
     
     # Check for duplicate values in label_values array (case-insensitive)
     label_values = label_data.label_values
@@ -70,13 +69,13 @@ def create_custom_label(
         db.commit()
         db.refresh(custom_label)
         
-        logging.info(f"Created custom label '{label_data.label_name}' with {len(label_data.label_values)} values for business {current_employee.business_id}")
+        logging.info("Created custom label '%s' with %d values for business %s", label_data.label_name, len(label_data.label_values), current_employee.business_id)
         
         return custom_label
         
     except Exception as e:
         db.rollback()
-        logging.error(f"Error creating custom label: {str(e)}")
+        logging.error("Error creating custom label: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create custom label: {str(e)}")
 
 
@@ -149,18 +148,18 @@ def update_custom_label(
         # Update label name if provided
         if label_data.label_name:
             # Check if new name conflicts with existing label (case-insensitive)
-            existing_labels = db.query(CustomLabel).filter(
+            existing_label_id = db.query(CustomLabel.id).filter(
                 CustomLabel.business_id == current_employee.business_id,
                 CustomLabel.label_type == label.label_type,
-                CustomLabel.id != label_id
-            ).all()
+                CustomLabel.id != label_id,
+                func.lower(CustomLabel.label_name) == label_data.label_name.lower()
+            ).first()
             
-            for existing in existing_labels:
-                if existing.label_name.lower() == label_data.label_name.lower():
-                    raise HTTPException(
-                        status_code=400,
-                        detail="Duplicate label names not allowed. A label with this name already exists (case-insensitive)."
-                    )
+            if existing_label_id:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Duplicate label names not allowed. A label with this name already exists (case-insensitive)."
+                )
             
             label.label_name = label_data.label_name
         
@@ -188,7 +187,7 @@ def update_custom_label(
         db.commit()
         db.refresh(label)
         
-        logging.info(f"Updated custom label '{label.label_name}' for business {current_employee.business_id}")
+        logging.info("Updated custom label '%s' for business %s", label.label_name, current_employee.business_id)
         
         return label
         
@@ -196,7 +195,7 @@ def update_custom_label(
         raise
     except Exception as e:
         db.rollback()
-        logging.error(f"Error updating custom label: {str(e)}")
+        logging.error("Error updating custom label: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to update custom label: {str(e)}")
 
 
@@ -222,13 +221,13 @@ def delete_custom_label(
         db.delete(label)
         db.commit()
         
-        logging.info(f"Deleted custom label '{label.label_name}' for business {current_employee.business_id}")
+        logging.info("Deleted custom label '%s' for business %s", label.label_name, current_employee.business_id)
         
         return {"id": label_id, "detail": "Custom label deleted successfully"}
         
     except Exception as e:
         db.rollback()
-        logging.error(f"Error deleting custom label: {str(e)}")
+        logging.error("Error deleting custom label: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete custom label: {str(e)}")
 
 
@@ -1,4 +1,6 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from typing import List
 import logging
@@ -20,10 +22,11 @@ from app.schemas.employees import (
     ResetPasswordRequest,
     ForgotUsernameRequest,
     VerifyOTPRequest,
-    ForgotPasswordOTPRequest,
-    ChangePasswordRequest
+    ChangePasswordRequest,
+    format_joining_date,
+    read_joining_date
 )
-from app.core.security import create_access_token, create_refresh_token, decode_token, is_refresh_token
+from app.core.security import create_access_token, create_refresh_token, decode_token
 from app.core.dependencies import get_current_employee, require_role
 from passlib.context import CryptContext
 from app.utils.email_service import send_registration_email, send_password_reset_email, send_otp_email, send_credentials_email
@@ -35,18 +38,38 @@ import shutil
 from pathlib import Path
 
 router = APIRouter()
-logging.basicConfig(level=logging.INFO)
+
+# Argon2 cost parameters, tunable per deployment to hit a target hash latency
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))  # KiB
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "4"))
 
 pwd_context = CryptContext(
     schemes=["argon2"],
     default="argon2",
     deprecated="auto",
+    argon2__time_cost=ARGON2_TIME_COST,
+    argon2__memory_cost=ARGON2_MEMORY_COST,
+    argon2__parallelism=ARGON2_PARALLELISM,
 )
 
+# Verified against on the unknown-user login path so a miss costs as much as a real check
+_DUMMY_HASH = pwd_context.hash("x" * 16)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password in a worker thread so argon2 does not block the event loop"""
+    return await asyncio.to_thread(pwd_context.hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread so argon2 does not block the event loop"""
+    return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
+
+
 @router.post("/register-owner", response_model=EmployeeSchema, status_code=status.HTTP_201_CREATED)
 async def register_owner(
     owner_data: OwnerRegistration,
@@ -57,19 +80,12 @@ async def register_owner(
         # Note: Same email can now register multiple businesses (owner in Business A, owner in Business B)
         # No email uniqueness check needed - composite constraint (email, business_id) allows this
         
-        # Validate password match
-        if owner_data.password != owner_data.confirm_password:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Passwords do not match"
-            )
-        
         # Hash password
         try:
-            logging.info(f"Creating owner account for {owner_data.name}")
-            hashed_password = pwd_context.hash(owner_data.password)
+            logging.info("Creating owner account for %s", owner_data.name)
+            hashed_password = await hash_password_async(owner_data.password)
         except Exception as e:
-            logging.error(f"Error hashing password: {str(e)}")
+            logging.error("Error hashing password: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error processing password: {str(e)}"
@@ -99,13 +115,13 @@ async def register_owner(
         db.add(business_record)
         db.commit()
         
-        logging.info(f"Owner account created successfully: {db_owner.name} (ID: {db_owner.emp_id}, Business ID: {db_owner.business_id})")
+        logging.info("Owner account created successfully: %s (ID: %s, Business ID: %s)", db_owner.name, db_owner.emp_id, db_owner.business_id)
         
         # Send registration email
         user_id = f"USR{db_owner.emp_id}"
         email_sent = False
         try:
-            logging.info(f"Attempting to send registration email to {owner_data.email}")
+            logging.info("Attempting to send registration email to %s", owner_data.email)
             email_sent = send_registration_email(
                 to_email=owner_data.email,
                 user_name=owner_data.name,
@@ -115,11 +131,11 @@ async def register_owner(
                 password=owner_data.password  # Send the password they just created
             )
             if email_sent:
-                logging.info(f"✅ Registration email sent successfully to {owner_data.email}")
+                logging.info("✅ Registration email sent successfully to %s", owner_data.email)
             else:
-                logging.warning(f"⚠️ Registration email failed to send to {owner_data.email}")
+                logging.warning("⚠️ Registration email failed to send to %s", owner_data.email)
         except Exception as e:
-            logging.error(f"❌ Exception while sending registration email: {str(e)}", exc_info=True)
+            logging.error("❌ Exception while sending registration email: %s", e, exc_info=True)
             # Don't fail registration if email fails
         
         return EmployeeSchema(
@@ -142,7 +158,7 @@ async def register_owner(
         raise
     except Exception as e:
         db.rollback()
-        logging.error(f"Error creating owner account: {str(e)}")
+        logging.error("Error creating owner account: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while creating the owner account. Please try again."
@@ -158,10 +174,10 @@ async def register_employee(
     """Register a new employee - requires owner or admin role"""
     try:
         # Check if email already exists in the SAME business
-        existing_employee = db.query(Employee).filter(
+        existing_employee = db.query(exists().where(
             Employee.email == employee.email,
             Employee.business_id == current_employee.business_id
-        ).first()
+        )).scalar()
         if existing_employee:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -170,11 +186,11 @@ async def register_employee(
         
         # Hash password
         try:
-            logging.info(f"Attempting to hash password for employee {employee.name}")
-            hashed_password = pwd_context.hash(employee.password)
-            logging.info(f"Successfully hashed password for employee {employee.name}")
+            logging.info("Attempting to hash password for employee %s", employee.name)
+            hashed_password = await hash_password_async(employee.password)
+            logging.info("Successfully hashed password for employee %s", employee.name)
         except Exception as e:
-            logging.error(f"Error hashing password: {str(e)}")
+            logging.error("Error hashing password: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error processing password: {str(e)}"
@@ -191,7 +207,7 @@ async def register_employee(
             state=employee.state,
             country=employee.country,
             role=employee.role,
-            joining_date=employee.joining_date,
+            joining_date=format_joining_date(employee.joining_date),
             custom_fields=employee.custom_fields,
             hashed_password=hashed_password
         )
@@ -246,11 +262,11 @@ async def create_employee(
         
         # Hash password
         try:
-            logging.info(f"Attempting to hash password for employee {employee.name}")
-            hashed_password = pwd_context.hash(employee.password)
-            logging.info(f"Successfully hashed password for employee {employee.name}")
+            logging.info("Attempting to hash password for employee %s", employee.name)
+            hashed_password = await hash_password_async(employee.password)
+            logging.info("Successfully hashed password for employee %s", employee.name)
         except Exception as e:
-            logging.error(f"Error hashing password: {str(e)}")
+            logging.error("Error hashing password: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error processing password: {str(e)}"
@@ -267,7 +283,7 @@ async def create_employee(
             state=employee.state,
             country=employee.country,
             role=employee.role,
-            joining_date=employee.joining_date,
+            joining_date=format_joining_date(employee.joining_date),
             custom_fields=None,  # Don't store in JSON, use employee_labels table
             hashed_password=hashed_password,
             business_id=current_employee.business_id,  # Use the same business_id as the creator
@@ -280,21 +296,20 @@ async def create_employee(
         db.refresh(db_employee)
         
         # Save custom labels to employee_labels table
-        logging.info(f"Custom fields data received: {employee.custom_fields}")
+        logging.info("Custom fields data received: %s", employee.custom_fields)
         if employee.custom_fields:
-            logging.info(f"Saving {len(employee.custom_fields)} custom field(s) to employee_labels table")
-            for field_obj in employee.custom_fields:
-                for label_name, label_value in field_obj.items():
-                    logging.info(f"Saving label: {label_name} = {label_value}")
-                    label = EmployeeLabel(
-                        emp_id=db_employee.emp_id,
-                        business_id=db_employee.business_id,
-                        label_name=label_name,
-                        label_value=label_value
-                    )
-                    db.add(label)
+            logging.info("Saving %d custom field(s) to employee_labels table", len(employee.custom_fields))
+            for label_name, label_value in employee.custom_fields.items():
+                logging.info("Saving label: %s = %s", label_name, label_value)
+                label = EmployeeLabel(
+                    emp_id=db_employee.emp_id,
+                    business_id=db_employee.business_id,
+                    label_name=label_name,
+                    label_value=label_value
+                )
+                db.add(label)
             db.commit()
-            logging.info(f"Successfully saved custom fields to employee_labels table")
+            logging.info("Successfully saved custom fields to employee_labels table")
         else:
             logging.info("No custom fields to save")
         
@@ -312,9 +327,9 @@ async def create_employee(
                 business_id=db_employee.business_id,
                 password=employee.password  # Send the password
             )
-            logging.info(f"Registration email sent to {employee.email}")
+            logging.info("Registration email sent to %s", employee.email)
         except Exception as e:
-            logging.error(f"Failed to send registration email: {str(e)}")
+            logging.error("Failed to send registration email: %s", e)
             # Don't fail registration if email fails
         
         return EmployeeSchema(
@@ -504,11 +519,9 @@ def get_employees(
         
         # Group labels by emp_id
         for label in labels_query:
-            if label.emp_id not in labels_by_emp:
-                labels_by_emp[label.emp_id] = []
-            labels_by_emp[label.emp_id].append({label.label_name: label.label_value})
+            labels_by_emp.setdefault(label.emp_id, {})[label.label_name] = label.label_value
     
-    # Build response list
+    # Build response list; rows come straight from the database, so skip re-validating them
     employee_list = []
     for emp in employees:
         # Get store details from dict (no query)
@@ -520,42 +533,39 @@ def get_employees(
             store_name = store.store_name
         
         # Get custom fields from dict (no query)
-        custom_fields = labels_by_emp.get(emp.emp_id, [])
+        custom_fields = labels_by_emp.get(emp.emp_id, {})
         
         # Avatars are now stored as URLs in GCS
         avatar_url = emp.avatar_url
         thumbnail_url = emp.thumbnail_url
         
-        emp_dict = {
-            "emp_id": emp.emp_id,
-            "business_id": emp.business_id,
-            "business_id_display": f"BUS{emp.business_id}",
-            "user_id": f"USR{emp.emp_id}",
-            "name": emp.name,
-            "email": emp.email,
-            "phone_number": emp.phone_number,
-            "aadhar_number": emp.aadhar_number,
-            "address": emp.address,
-            "city": emp.city,
-            "state": emp.state,
-            "country": emp.country,
-            "role": emp.role,
-            "joining_date": emp.joining_date,
-            "custom_fields": custom_fields if custom_fields else None,
-            "store_id": emp.store_id,
-            "store_id_display": store_id_display,
-            "store_name": store_name,
-            "created_by": emp.created_by,
-            "updated_by": emp.updated_by,
-            "avatar_url": avatar_url,
-            "thumbnail_url": thumbnail_url
-        }
-        employee_list.append(emp_dict)
+        employee_list.append(EmployeeSchema.model_construct(
+            emp_id=emp.emp_id,
+            business_id=emp.business_id,
+            name=emp.name,
+            email=emp.email,
+            phone_number=emp.phone_number,
+            aadhar_number=emp.aadhar_number,
+            address=emp.address,
+            city=emp.city,
+            state=emp.state,
+            country=emp.country,
+            role=emp.role,
+            joining_date=read_joining_date(emp.joining_date),
+            custom_fields=custom_fields,
+            store_id=emp.store_id,
+            store_id_display=store_id_display,
+            store_name=store_name,
+            created_by=emp.created_by,
+            updated_by=emp.updated_by,
+            avatar_url=avatar_url,
+            thumbnail_url=thumbnail_url
+        ))
     
     # Calculate page number (0-indexed)
     page = skip // limit if limit > 0 else 0
     
-    return EmployeePaginatedResponse(
+    return EmployeePaginatedResponse.model_construct(
         items=employee_list,
         total=total,
         page=page,
@@ -655,7 +665,7 @@ def define_custom_label(
             
             db.commit()
             
-            logging.info(f"Updated custom label '{label_name}' with {new_count} new value(s) for business {current_employee.business_id}")
+            logging.info("Updated custom label '%s' with %s new value(s) for business %s", label_name, new_count, current_employee.business_id)
             
             return {
                 "message": f"Custom label '{label_name}' updated successfully",
@@ -675,7 +685,7 @@ def define_custom_label(
             db.add(template_label)
             db.commit()
             
-            logging.info(f"Created custom label '{label_name}' with {len(valid_values)} value(s) for business {current_employee.business_id}")
+            logging.info("Created custom label '%s' with %d value(s) for business %s", label_name, len(valid_values), current_employee.business_id)
             
             return {
                 "message": f"Custom label '{label_name}' created successfully",
@@ -685,7 +695,7 @@ def define_custom_label(
         
     except Exception as e:
         db.rollback()
-        logging.error(f"Error defining custom label: {str(e)}")
+        logging.error("Error defining custom label: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to save custom label: {str(e)}")
 
 
@@ -696,7 +706,7 @@ def get_current_employee_profile(
     db: Session = Depends(get_db)
 ):
     """Get current logged-in employee profile data"""
-    logging.info(f"Getting profile for employee ID: {current_employee.emp_id}, Name: {current_employee.name}")
+    logging.info("Getting profile for employee ID: %s, Name: %s", current_employee.emp_id, current_employee.name)
     
     # Get store details if employee has a store_id
     store_id_display = None
@@ -708,22 +718,20 @@ def get_current_employee_profile(
             store_name = store.store_name
     
     # Load custom fields from employee_labels table
-    custom_fields = []
+    custom_fields = {}
     labels = db.query(EmployeeLabel).filter(
         EmployeeLabel.emp_id == current_employee.emp_id,
         EmployeeLabel.business_id == current_employee.business_id
     ).all()
     for label in labels:
-        custom_fields.append({label.label_name: label.label_value})
+        custom_fields[label.label_name] = label.label_value
     
-    logging.info(f"Employee profile retrieved for: {current_employee.name}")
+    logging.info("Employee profile retrieved for: %s", current_employee.name)
     
-    # Return formatted response with business_id_display
+    # Return formatted response; user_id and business_id_display are computed by the schema
     return {
         "emp_id": current_employee.emp_id,
         "business_id": current_employee.business_id,
-        "business_id_display": f"BUS{current_employee.business_id}",
-        "user_id": f"USR{current_employee.emp_id}",
         "name": current_employee.name,
         "email": current_employee.email,
         "phone_number": current_employee.phone_number,
@@ -734,7 +742,7 @@ def get_current_employee_profile(
         "country": current_employee.country,
         "role": current_employee.role,
         "joining_date": current_employee.joining_date,
-        "custom_fields": custom_fields if custom_fields else None,
+        "custom_fields": custom_fields,
         "store_id": current_employee.store_id,
         "store_id_display": store_id_display,
         "store_name": store_name,
@@ -804,7 +812,7 @@ async def upload_avatar(
         db.commit()
         db.refresh(current_employee)
         
-        logging.info(f"Avatar uploaded successfully for employee {current_employee.emp_id}")
+        logging.info("Avatar uploaded successfully for employee %s", current_employee.emp_id)
         
         return {
             "message": "Avatar uploaded successfully",
@@ -813,7 +821,7 @@ async def upload_avatar(
         }
     except Exception as e:
         db.rollback()
-        logging.error(f"Error uploading avatar: {str(e)}")
+        logging.error("Error uploading avatar: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload avatar: {str(e)}"
@@ -844,7 +852,7 @@ async def delete_avatar(
         return {"message": "Avatar deleted successfully"}
     except Exception as e:
         db.rollback()
-        logging.error(f"Error deleting avatar: {str(e)}")
+        logging.error("Error deleting avatar: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete avatar: {str(e)}"
@@ -875,20 +883,18 @@ def get_employee(
             store_name = store.store_name
     
     # Load custom fields from employee_labels table
-    custom_fields = []
+    custom_fields = {}
     labels = db.query(EmployeeLabel).filter(
         EmployeeLabel.emp_id == db_employee.emp_id,
         EmployeeLabel.business_id == db_employee.business_id
     ).all()
     for label in labels:
-        custom_fields.append({label.label_name: label.label_value})
+        custom_fields[label.label_name] = label.label_value
     
-    # Return formatted response with business_id_display
+    # Return formatted response; user_id and business_id_display are computed by the schema
     return {
         "emp_id": db_employee.emp_id,
         "business_id": db_employee.business_id,
-        "business_id_display": f"BUS{db_employee.business_id}",
-        "user_id": f"USR{db_employee.emp_id}",
         "name": db_employee.name,
         "email": db_employee.email,
         "phone_number": db_employee.phone_number,
@@ -899,7 +905,7 @@ def get_employee(
         "country": db_employee.country,
         "role": db_employee.role,
         "joining_date": db_employee.joining_date,
-        "custom_fields": custom_fields if custom_fields else None,
+        "custom_fields": custom_fields,
         "store_id": db_employee.store_id,
         "store_id_display": store_id_display,
         "store_name": store_name,
@@ -934,10 +940,10 @@ def update_employee(
     
     # Check if email is being changed and if it's already taken in the same business
     if employee_update.email and employee_update.email != db_employee.email:
-        email_exists = db.query(Employee).filter(
+        email_exists = db.query(exists().where(
             Employee.email == employee_update.email,
             Employee.business_id == current_employee.business_id
-        ).first()
+        )).scalar()
         if email_exists:
             raise HTTPException(status_code=400, detail="Email already registered in your business")
     
@@ -957,28 +963,27 @@ def update_employee(
     db.commit()
     
     # Update custom labels in employee_labels table
-    logging.info(f"Custom fields data received for update: {custom_fields_data}")
+    logging.info("Custom fields data received for update: %s", custom_fields_data)
     if custom_fields_data is not None:
         # Delete existing labels for this employee
         deleted_count = db.query(EmployeeLabel).filter(
             EmployeeLabel.emp_id == emp_id
         ).delete()
-        logging.info(f"Deleted {deleted_count} existing label(s) for employee {emp_id}")
+        logging.info("Deleted %s existing label(s) for employee %s", deleted_count, emp_id)
         
         # Add new labels
         if custom_fields_data:
-            logging.info(f"Saving {len(custom_fields_data)} custom field(s) to employee_labels table")
-            for field_obj in custom_fields_data:
-                for label_name, label_value in field_obj.items():
-                    logging.info(f"Saving label: {label_name} = {label_value}")
-                    label = EmployeeLabel(
-                        emp_id=emp_id,
-                        business_id=db_employee.business_id,
-                        label_name=label_name,
-                        label_value=label_value
-                    )
-                    db.add(label)
-            logging.info(f"Successfully saved custom fields to employee_labels table")
+            logging.info("Saving %d custom field(s) to employee_labels table", len(custom_fields_data))
+            for label_name, label_value in custom_fields_data.items():
+                logging.info("Saving label: %s = %s", label_name, label_value)
+                label = EmployeeLabel(
+                    emp_id=emp_id,
+                    business_id=db_employee.business_id,
+                    label_name=label_name,
+                    label_value=label_value
+                )
+                db.add(label)
+            logging.info("Successfully saved custom fields to employee_labels table")
         else:
             logging.info("No custom fields to save (custom_fields is empty)")
         db.commit()
@@ -1006,9 +1011,9 @@ def delete_employee(
     # Check if employee is an owner with associated business
     if db_employee.role == "owner":
         # Check if this owner has a business registered
-        associated_business = db.query(Business).filter(
+        associated_business = db.query(exists().where(
             Business.business_id == str(db_employee.business_id)
-        ).first()
+        )).scalar()
         
         if associated_business:
             raise HTTPException(
@@ -1041,16 +1046,17 @@ async def authenticate_employee(employee_details: EmployeeLogin, db: Session = D
                 detail="Invalid user ID format. Use format: USR1000"
             )
         
-        logging.info(f"Authenticating employee with user ID: {user_id_str} (emp_id: {emp_id})")
+        logging.info("Authenticating employee with user ID: %s (emp_id: %s)", user_id_str, emp_id)
         db_employee = db.query(Employee).filter(Employee.emp_id == emp_id).first()
         
         if not db_employee:
+            await verify_password_async(employee_details.password, _DUMMY_HASH)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found. Please check your User ID."
             )
         
-        if not verify_password(employee_details.password, db_employee.hashed_password):
+        if not await verify_password_async(employee_details.password, db_employee.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect password. Please try again."
@@ -1063,7 +1069,7 @@ async def authenticate_employee(employee_details: EmployeeLogin, db: Session = D
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error during authentication: {str(e)}")
+        logging.error("Error during authentication: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred during login"
@@ -1073,13 +1079,12 @@ async def authenticate_employee(employee_details: EmployeeLogin, db: Session = D
 @router.post("/refresh", response_model=TokenWithRefresh)
 async def refresh_token(request: RefreshTokenRequest):
     """Refresh access token using refresh token"""
-    # Validate refresh token
-    if not is_refresh_token(request.refresh_token):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
-
+    # Validate refresh token: decode (and verify the signature) once, then check its type
     payload = decode_token(request.refresh_token)
     if not payload:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token")
+    if payload.get("type") != "refresh":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
     emp_id = payload.get("sub")
     role = payload.get("role")
@@ -1137,9 +1142,9 @@ async def forgot_password(request: ForgotPasswordRequest, db: Session = Depends(
                 reset_token=reset_token,
                 user_id=request.user_id
             )
-            logging.info(f"Password reset email sent to {employee.email}")
+            logging.info("Password reset email sent to %s", employee.email)
         except Exception as e:
-            logging.error(f"Failed to send password reset email: {str(e)}")
+            logging.error("Failed to send password reset email: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to send password reset email. Please try again later."
@@ -1150,7 +1155,7 @@ async def forgot_password(request: ForgotPasswordRequest, db: Session = Depends(
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in forgot password: {str(e)}")
+        logging.error("Error in forgot password: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred processing your request"
@@ -1163,13 +1168,6 @@ async def reset_password(request: ResetPasswordRequest, db: Session = Depends(ge
     Reset password using token from email
     """
     try:
-        # Validate passwords match
-        if request.new_password != request.confirm_password:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Passwords do not match"
-            )
-        
         # Validate token
         payload = decode_token(request.token)
         if not payload or payload.get("type") != "password_reset":
@@ -1203,13 +1201,13 @@ async def reset_password(request: ResetPasswordRequest, db: Session = Depends(ge
             )
         
         # Hash new password
-        hashed_password = pwd_context.hash(request.new_password)
+        hashed_password = await hash_password_async(request.new_password)
         
         # Update password
         employee.hashed_password = hashed_password
         db.commit()
         
-        logging.info(f"Password reset successful for employee {employee.name} (ID: {employee.emp_id})")
+        logging.info("Password reset successful for employee %s (ID: %s)", employee.name, employee.emp_id)
         
         return {"message": "Password reset successful. You can now login with your new password."}
     
@@ -1217,7 +1215,7 @@ async def reset_password(request: ResetPasswordRequest, db: Session = Depends(ge
         raise
     except Exception as e:
         db.rollback()
-        logging.error(f"Error in reset password: {str(e)}")
+        logging.error("Error in reset password: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred resetting your password"
@@ -1273,9 +1271,9 @@ async def forgot_username_otp(request: ForgotUsernameRequest, db: Session = Depe
                 user_name=employees[0].name,  # Use first name (should be same person)
                 user_ids=user_ids
             )
-            logging.info(f"Username recovery sent to {request.email} with {len(user_ids)} user ID(s)")
+            logging.info("Username recovery sent to %s with %d user ID(s)", request.email, len(user_ids))
         except Exception as e:
-            logging.error(f"Failed to send credentials email: {str(e)}")
+            logging.error("Failed to send credentials email: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to send email. Please try again later."
@@ -1286,7 +1284,7 @@ async def forgot_username_otp(request: ForgotUsernameRequest, db: Session = Depe
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in forgot username OTP: {str(e)}")
+        logging.error("Error in forgot username OTP: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred processing your request"
@@ -1294,7 +1292,7 @@ async def forgot_username_otp(request: ForgotUsernameRequest, db: Session = Depe
 
 
 @router.post("/forgot-password-otp")
-async def forgot_password_otp(request: ForgotPasswordOTPRequest, db: Session = Depends(get_db)):
+async def forgot_password_otp(request: ForgotPasswordRequest, db: Session = Depends(get_db)):
     """
     Send OTP to email for password recovery
     Requires BOTH user_id and email since same email can exist in multiple businesses
@@ -1342,9 +1340,9 @@ async def forgot_password_otp(request: ForgotPasswordOTPRequest, db: Session = D
                 otp=otp,
                 purpose="reset your password"
             )
-            logging.info(f"Password recovery OTP sent to {employee.email}")
+            logging.info("Password recovery OTP sent to %s", employee.email)
         except Exception as e:
-            logging.error(f"Failed to send OTP email: {str(e)}")
+            logging.error("Failed to send OTP email: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to send OTP email. Please try again later."
@@ -1355,7 +1353,7 @@ async def forgot_password_otp(request: ForgotPasswordOTPRequest, db: Session = D
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in forgot password OTP: {str(e)}")
+        logging.error("Error in forgot password OTP: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred processing your request"
@@ -1399,9 +1397,9 @@ async def verify_otp_username(request: VerifyOTPRequest, db: Session = Depends(g
                 user_id=user_id,
                 new_password=None  # No password for username recovery
             )
-            logging.info(f"Username sent to {employee.email}")
+            logging.info("Username sent to %s", employee.email)
         except Exception as e:
-            logging.error(f"Failed to send credentials email: {str(e)}")
+            logging.error("Failed to send credentials email: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to send credentials email. Please try again later."
@@ -1412,7 +1410,7 @@ async def verify_otp_username(request: VerifyOTPRequest, db: Session = Depends(g
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in verify OTP username: {str(e)}")
+        logging.error("Error in verify OTP username: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred processing your request"
@@ -1454,7 +1452,7 @@ async def verify_otp_password(request: VerifyOTPRequest, db: Session = Depends(g
         temp_password = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(12))
         
         # Hash and update password
-        hashed_password = pwd_context.hash(temp_password)
+        hashed_password = await hash_password_async(temp_password)
         employee.hashed_password = hashed_password
         db.commit()
         
@@ -1466,10 +1464,10 @@ async def verify_otp_password(request: VerifyOTPRequest, db: Session = Depends(g
                 user_id=user_id,
                 new_password=temp_password
             )
-            logging.info(f"Temporary password sent to {employee.email}")
+            logging.info("Temporary password sent to %s", employee.email)
         except Exception as e:
             db.rollback()
-            logging.error(f"Failed to send credentials email: {str(e)}")
+            logging.error("Failed to send credentials email: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to send credentials email. Please try again later."
@@ -1482,7 +1480,7 @@ async def verify_otp_password(request: VerifyOTPRequest, db: Session = Depends(g
         raise
     except Exception as e:
         db.rollback()
-        logging.error(f"Error in verify OTP password: {str(e)}")
+        logging.error("Error in verify OTP password: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred processing your request"
@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 import razorpay
+import hashlib
+import hmac
 import os
 import logging
 from dotenv import load_dotenv
@@ -19,7 +21,6 @@ from app.schemas.payment import (
 load_dotenv()
 
 router = APIRouter()
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Razorpay credentials from environment variables
@@ -33,6 +34,16 @@ if not RAZORPAY_KEY_ID or not RAZORPAY_KEY_SECRET:
 # Initialize Razorpay client
 razorpay_client = razorpay.Client(auth=(RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET))
 
+# HMAC keyed once with the secret; each verification works on a copy
+SIGNATURE_HMAC = hmac.new(RAZORPAY_KEY_SECRET.encode(), digestmod=hashlib.sha256)
+
+
+def verify_payment_signature(order_id: str, payment_id: str, signature: str) -> bool:
+    """Check a checkout signature: hex HMAC-SHA256 of "order_id|payment_id" under the key secret"""
+    mac = SIGNATURE_HMAC.copy()
+    mac.update(f"{order_id}|{payment_id}".encode())
+    return hmac.compare_digest(mac.hexdigest().encode(), signature.encode())
+
 
 @router.get("/razorpay-key")
 async def get_razorpay_key():
@@ -52,7 +63,7 @@ async def create_payment_order(
     """
     try:
         # Verify user exists
-        logger.info(f"Received payment order request for user_id: {request.user_id}")
+        logger.info("Received payment order request for user_id: %s", request.user_id)
         
         if not request.user_id:
             raise HTTPException(
@@ -117,7 +128,7 @@ async def create_payment_order(
         try:
             razorpay_order = razorpay_client.order.create(data=order_data)
         except Exception as razorpay_error:
-            logger.error(f"Razorpay order creation failed: {str(razorpay_error)}")
+            logger.error("Razorpay order creation failed: %s", razorpay_error)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Unable to create payment order. Please try again in a few moments."
@@ -130,7 +141,7 @@ async def create_payment_order(
             
             if existing_payment:
                 # Update existing payment record
-                logger.info(f"Updating existing payment for business {employee.business_id}")
+                logger.info("Updating existing payment for business %s", employee.business_id)
                 existing_payment.user_id = emp_id
                 existing_payment.razorpay_order_id = razorpay_order["id"]
                 existing_payment.amount = request.amount
@@ -143,7 +154,7 @@ async def create_payment_order(
                 payment = existing_payment
             else:
                 # Create new payment record
-                logger.info(f"Creating new payment for business {employee.business_id}")
+                logger.info("Creating new payment for business %s", employee.business_id)
                 payment = Payment(
                     user_id=emp_id,
                     business_id=employee.business_id,
@@ -158,14 +169,14 @@ async def create_payment_order(
             db.commit()
             db.refresh(payment)
         except Exception as db_error:
-            logger.error(f"Database error saving payment: {str(db_error)}")
+            logger.error("Database error saving payment: %s", db_error)
             db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Payment order created but failed to save. Please contact support."
             )
         
-        logger.info(f"Payment order created: {razorpay_order['id']} for user {request.user_id}")
+        logger.info("Payment order created: %s for user %s", razorpay_order['id'], request.user_id)
         
         return PaymentOrderResponse(
             order_id=razorpay_order["id"],
@@ -177,7 +188,7 @@ async def create_payment_order(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error creating payment order: {str(e)}")
+        logger.error("Unexpected error creating payment order: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -205,18 +216,10 @@ async def verify_payment(
                 detail="Payment order not found"
             )
         
-        # Verify payment signature using Razorpay's signature verification
+        # Verify payment signature using Razorpay's signature scheme
         # This ensures the payment response is authentic and hasn't been tampered with
-        try:
-            # Method 1: Using Razorpay's utility (recommended)
-            razorpay_client.utility.verify_payment_signature({
-                'razorpay_order_id': request.razorpay_order_id,
-                'razorpay_payment_id': request.razorpay_payment_id,
-                'razorpay_signature': request.razorpay_signature
-            })
-            logger.info(f"Payment signature verified successfully for order {request.razorpay_order_id}")
-        except razorpay.errors.SignatureVerificationError as e:
-            logger.error(f"Signature verification failed for order {request.razorpay_order_id}: {str(e)}")
+        if not verify_payment_signature(request.razorpay_order_id, request.razorpay_payment_id, request.razorpay_signature):
+            logger.error("Signature verification failed for order %s", request.razorpay_order_id)
             # Update payment status to failed
             payment.status = "failed"
             db.commit()
@@ -224,12 +227,13 @@ async def verify_payment(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid payment signature. Payment verification failed."
             )
+        logger.info("Payment signature verified successfully for order %s", request.razorpay_order_id)
         
         # Fetch payment details from Razorpay
         try:
             razorpay_payment = razorpay_client.payment.fetch(request.razorpay_payment_id)
         except Exception as e:
-            logger.error(f"Error fetching payment from Razorpay: {str(e)}")
+            logger.error("Error fetching payment from Razorpay: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to verify payment with Razorpay"
@@ -247,7 +251,7 @@ async def verify_payment(
         
         db.commit()
         
-        logger.info(f"Payment verified successfully: {request.razorpay_payment_id} for order {request.razorpay_order_id}")
+        logger.info("Payment verified successfully: %s for order %s", request.razorpay_payment_id, request.razorpay_order_id)
         
         return PaymentVerifyResponse(
             success=True,
@@ -258,7 +262,7 @@ async def verify_payment(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error verifying payment: {str(e)}")
+        logger.error("Error verifying payment: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Payment verification failed: {str(e)}"
@@ -306,7 +310,7 @@ async def get_payment_status(
             current_time = datetime.utcnow()
             if payment.expires_at and current_time > payment.expires_at:
                 # Payment expired - mark as expired and return as not completed
-                logger.info(f"Payment expired for business {employee.business_id}. Expiry time: {payment.expires_at}")
+                logger.info("Payment expired for business %s. Expiry time: %s", employee.business_id, payment.expires_at)
                 payment.status = "expired"
                 db.commit()
                 
@@ -345,7 +349,7 @@ async def get_payment_status(
             }
     
     except Exception as e:
-        logger.error(f"Error checking payment status: {str(e)}")
+        logger.error("Error checking payment status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to check payment status"
@@ -1,141 +1,421 @@
+import asyncio
+import base64
+import binascii
 import datetime
+import json
 import logging
+import os
+import re
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError, DatabaseError, OperationalError
+import asyncpg
+from fastapi import APIRouter, Depends, status, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import DBAPIError, IntegrityError, DatabaseError, OperationalError
 from pydantic import ValidationError
 
-from app.database import get_db
+from app.database import get_async_db, AsyncSessionLocal
 from app.models.products import Products
 from app.models.employees import Employee
-from app.schemas.products import ProductBase, ProductResponse, ProductUpdate
-from app.core.dependencies import get_current_employee, require_role
+from app.schemas.products import (
+    ProductBase, ProductResponse, ProductUpdate, ProductListItem, ProductListResponse, ProductSearchResponse,
+    ProductDeleteResponse, ProductBulkDeleteResponse
+)
+from app.core.dependencies import get_current_employee_async, require_role_async
 from app.services.storage_service import storage_service
 
 
 router = APIRouter()
-logging.basicConfig(level=logging.INFO)
+
+
+FIELD_LABELS = {"productid": "product ID", "barcode": "barcode", "sku": "SKU"}
+
+
+def _duplicate_error(field: str) -> dict:
+    return {
+        "error": "DuplicateEntryError",
+        "message": f"A product with this {FIELD_LABELS[field]} already exists in the database",
+        "field": field,
+        "type": "duplicate_constraint",
+        "suggestion": f"Please use a different {FIELD_LABELS[field]}"
+    }
+
+
+# Static error details are built once; callers only read them
+DUPLICATE_FIELD_ERRORS = {field: _duplicate_error(field) for field in FIELD_LABELS}
+
+DUPLICATE_ENTRY_ERROR = {
+    "error": "DuplicateEntryError",
+    "message": "This product already exists in the database",
+    "type": "duplicate_constraint",
+    "suggestion": "Please check your data for duplicate values"
+}
+
+MISSING_FIELD_ERROR = {
+    "error": "MissingRequiredFieldError",
+    "message": "One or more required fields are missing",
+    "type": "missing_field",
+    "suggestion": "Please ensure all required fields (productid, productname, barcode, price) are provided"
+}
+
+FOREIGN_KEY_ERROR = {
+    "error": "ForeignKeyConstraintError",
+    "message": "Referenced data does not exist",
+    "type": "foreign_key_violation",
+    "suggestion": "Please ensure all referenced data exists before creating this product"
+}
+
+CONSTRAINT_ERROR = {
+    "error": "DatabaseConstraintError",
+    "message": "Database constraint violation occurred",
+    "type": "constraint_violation",
+    "suggestion": "Please check your data meets all database requirements"
+}
+
+DATABASE_CONNECTION_ERROR = {
+    "error": "DatabaseConnectionError",
+    "message": "Unable to connect to the database or query execution failed",
+    "type": "database_connection",
+    "suggestion": "Please try again later or contact system administrator"
+}
+
+DATABASE_ERROR = {
+    "error": "DatabaseError",
+    "message": "A database error occurred while processing your request",
+    "type": "database_error",
+    "suggestion": "Please verify your data and try again"
+}
+
+ATTRIBUTE_ERROR = {
+    "error": "AttributeError",
+    "message": "Invalid attribute or missing field in product data",
+    "type": "attribute_error",
+    "suggestion": "Please ensure all required fields are properly formatted"
+}
+
+
+def _duplicate_field(e: IntegrityError) -> Optional[str]:
+    """Barcode or SKU column named by a unique violation, or None for any other constraint"""
+    error_msg = str(getattr(e, "orig", e)).lower()
+    if "unique" not in error_msg and "duplicate key" not in error_msg:
+        return None
+    for field in ("barcode", "sku"):
+        if f"({field})" in error_msg or f"products_{field}" in error_msg:
+            return field
+    return None
+
+
+def _duplicate_detail(error_msg: str) -> dict:
+    for field in ("productid", "barcode", "sku"):
+        if field in error_msg:
+            return DUPLICATE_FIELD_ERRORS[field]
+    return DUPLICATE_ENTRY_ERROR
+
+
+# First matching substring of the lowercased driver message wins
+INTEGRITY_RULES = (
+    ("unique constraint", _duplicate_detail),
+    ("duplicate key", _duplicate_detail),
+    ("not null", lambda _: MISSING_FIELD_ERROR),
+    ("null value", lambda _: MISSING_FIELD_ERROR),
+    ("foreign key", lambda _: FOREIGN_KEY_ERROR),
+)
+
+
+def _integrity_error_detail(e: IntegrityError, context: str) -> dict:
+    error_msg = str(getattr(e, "orig", e)).lower()
+    for needle, handler in INTEGRITY_RULES:
+        if needle in error_msg:
+            return handler(error_msg)
+    return CONSTRAINT_ERROR
+
+
+def _validation_error_detail(e: ValidationError, context: str) -> dict:
+    return {
+        "error": "ValidationError",
+        "message": "Product data validation failed",
+        "type": "validation_error",
+        "validation_details": e.errors(),
+        "suggestion": "Please check your product data format and required fields"
+    }
+
+
+def _value_error_detail(e: ValueError, context: str) -> dict:
+    return {
+        "error": "ValueError",
+        "message": str(e) or "Invalid value provided",
+        "type": "value_error",
+        "suggestion": "Please check the data types and values of your input"
+    }
+
+
+def _generic_error_detail(e: Exception, context: str) -> dict:
+    return {
+        "error": "InternalServerError",
+        "message": f"An unexpected error occurred while {context}" if context else (str(e) or "An unexpected error occurred"),
+        "type": "server_error",
+        "suggestion": "Please try again or contact support if the issue persists"
+    }
+
+
+# Looked up along the exception's MRO, so subclasses resolve to the most specific handler
+EXCEPTION_DETAIL_HANDLERS = {
+    IntegrityError: _integrity_error_detail,
+    OperationalError: lambda e, context: DATABASE_CONNECTION_ERROR,
+    DatabaseError: lambda e, context: DATABASE_ERROR,
+    ValidationError: _validation_error_detail,
+    ValueError: _value_error_detail,
+    AttributeError: lambda e, context: ATTRIBUTE_ERROR,
+}
 
 
 def parse_exception_to_error_detail(e: Exception, context: str = "") -> dict:
     """
     Parse exception into a structured error detail dictionary with clear messages
     """
-    if isinstance(e, IntegrityError):
-        error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
-        
-        if "unique constraint" in error_msg.lower() or "duplicate key" in error_msg.lower():
-            if "productid" in error_msg.lower():
-                return {
-                    "error": "DuplicateEntryError",
-                    "message": "A product with this product ID already exists in the database",
-                    "field": "productid",
-                    "type": "duplicate_constraint",
-                    "suggestion": "Please use a different product ID"
-                }
-            elif "barcode" in error_msg.lower():
-                return {
-                    "error": "DuplicateEntryError",
-                    "message": "A product with this barcode already exists in the database",
-                    "field": "barcode",
-                    "type": "duplicate_constraint",
-                    "suggestion": "Please use a different barcode"
-                }
-            elif "sku" in error_msg.lower():
-                return {
-                    "error": "DuplicateEntryError",
-                    "message": "A product with this SKU already exists in the database",
-                    "field": "sku",
-                    "type": "duplicate_constraint",
-                    "suggestion": "Please use a different SKU"
-                }
-            else:
-                return {
-                    "error": "DuplicateEntryError",
-                    "message": "This product already exists in the database",
-                    "type": "duplicate_constraint",
-                    "suggestion": "Please check your data for duplicate values"
-                }
-        elif "not null" in error_msg.lower() or "null value" in error_msg.lower():
-            return {
-                "error": "MissingRequiredFieldError",
-                "message": "One or more required fields are missing",
-                "type": "missing_field",
-                "suggestion": "Please ensure all required fields (productid, productname, barcode, price) are provided"
-            }
-        elif "foreign key" in error_msg.lower():
-            return {
-                "error": "ForeignKeyConstraintError",
-                "message": "Referenced data does not exist",
-                "type": "foreign_key_violation",
-                "suggestion": "Please ensure all referenced data exists before creating this product"
+    for cls in type(e).__mro__:
+        handler = EXCEPTION_DETAIL_HANDLERS.get(cls)
+        if handler:
+            return handler(e, context)
+    return _generic_error_detail(e, context)
+
+
+# Columns needed to build a ProductResponse, so list endpoints can skip the rest
+PRODUCT_RESPONSE_COLUMNS = [getattr(Products, field) for field in ProductResponse.model_fields]
+
+
+def product_response(source, model: type = ProductResponse) -> ProductResponse:
+    """
+    Build a ProductResponse (or subclass such as ProductListItem) from a
+    PRODUCT_RESPONSE_COLUMNS row or a Products object
+    
+    The values come from the database, so the model is constructed without re-running
+    validation; productid is filled as PRD{id} if it has not been set yet.
+    """
+    product = {field: getattr(source, field) for field in model.model_fields}
+    if not product["productid"]:
+        product["productid"] = f"PRD{product['id']}"
+    return model.model_construct(**product)
+
+
+def build_prefix_tsquery(query: str) -> Optional[str]:
+    """
+    Build a to_tsquery() string matching every word of the search text as a prefix
+    e.g. "dell lap" -> "dell:* & lap:*". Returns None if the text has no searchable words
+    """
+    terms = re.findall(r"\w+", query.lower())
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the last seen product id as an opaque base64url cursor"""
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by encode_cursor back into the last seen product id"""
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "ValidationError",
+                "message": "Invalid pagination cursor",
+                "field": "cursor",
+                "type": "invalid_cursor"
             }
-        else:
-            return {
-                "error": "DatabaseConstraintError",
-                "message": "Database constraint violation occurred",
-                "type": "constraint_violation",
-                "suggestion": "Please check your data meets all database requirements"
+        )
+
+
+# Largest list accepted by the bulk endpoints
+MAX_BATCH_SIZE = 5000
+
+
+def check_batch_size(count: int, items: str):
+    """Reject bulk payloads that would hold a transaction open for too long"""
+    if count > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "error": "PayloadTooLargeError",
+                "message": f"At most {MAX_BATCH_SIZE} {items} can be sent in one request, got {count}",
+                "type": "batch_too_large",
+                "suggestion": "Please split the request into smaller batches"
             }
+        )
+
+
+# Batches at least this large are loaded with COPY instead of a multi-row INSERT
+COPY_THRESHOLD = 100
+
+# Columns written by add_products, in COPY order
+PRODUCT_INSERT_COLUMNS = [
+    "business_id", "productid", "productname", "barcode", "sku", "description", "brand",
+    "category", "productimages", "price", "unitvalue", "unit", "discount", "gst",
+    "openingstock", "quantity", "mfgdate", "expirydate", "suppliername", "suppliercontact",
+    "customfields", "updated_by"
+]
+
+
+def product_copy_records(product_rows: List[Dict[str, Any]]) -> List[tuple]:
+    """
+    COPY records for product_rows: (import_order, *PRODUCT_INSERT_COLUMNS) tuples
+    JSON columns are serialized here since COPY does not go through the ORM types
+    """
+    records = []
+    for order, row in enumerate(product_rows):
+        values = []
+        for column in PRODUCT_INSERT_COLUMNS:
+            value = row.get(column)
+            if value is not None and column in ("productimages", "customfields"):
+                value = json.dumps(value)
+            values.append(value)
+        records.append((order, *values))
+    return records
+
+
+async def copy_insert_products(db: AsyncSession, product_rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Insert product rows with PostgreSQL COPY and return {barcode: new id} for the inserted rows
+    COPY cannot return ids, so rows are copied into a temp table and moved with INSERT ... SELECT
+    Rows that hit a unique constraint are skipped (ON CONFLICT DO NOTHING) and left out of the result
     
-    elif isinstance(e, OperationalError):
-        return {
-            "error": "DatabaseConnectionError",
-            "message": "Unable to connect to the database or query execution failed",
-            "type": "database_connection",
-            "suggestion": "Please try again later or contact system administrator"
-        }
+    Only the COPY itself runs on the raw asyncpg connection; the other statements go
+    through the session so their errors arrive as SQLAlchemy exceptions (e.g. IntegrityError)
+    """
+    records = product_copy_records(product_rows)
+    columns = ", ".join(PRODUCT_INSERT_COLUMNS)
     
-    elif isinstance(e, DatabaseError):
-        return {
-            "error": "DatabaseError",
-            "message": "A database error occurred while processing your request",
-            "type": "database_error",
-            "suggestion": "Please verify your data and try again"
-        }
+    # Dropped by PostgreSQL when the transaction ends
+    await db.execute(text(
+        f"CREATE TEMP TABLE products_import ON COMMIT DROP AS "
+        f"SELECT {columns} FROM products WITH NO DATA"
+    ))
+    await db.execute(text("ALTER TABLE products_import ADD COLUMN import_order integer"))
     
-    elif isinstance(e, ValidationError):
-        return {
-            "error": "ValidationError",
-            "message": "Product data validation failed",
-            "type": "validation_error",
-            "validation_details": e.errors(),
-            "suggestion": "Please check your product data format and required fields"
-        }
+    # Raw asyncpg connection of the session's transaction
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    try:
+        await raw_connection.driver_connection.copy_records_to_table(
+            "products_import",
+            records=records,
+            columns=["import_order", *PRODUCT_INSERT_COLUMNS]
+        )
+    except asyncpg.PostgresError as e:
+        # The temp table has no constraints, so these are data errors (e.g. a value
+        # too long); wrap them the way the session would
+        raise DBAPIError.instance("COPY products_import", None, e, asyncpg.PostgresError)
     
-    elif isinstance(e, ValueError):
-        return {
-            "error": "ValueError",
-            "message": str(e) or "Invalid value provided",
-            "type": "value_error",
-            "suggestion": "Please check the data types and values of your input"
-        }
+    inserted = await db.execute(text(
+        f"INSERT INTO products ({columns}) "
+        f"SELECT {columns} FROM products_import ORDER BY import_order "
+        f"ON CONFLICT DO NOTHING RETURNING id, barcode"
+    ))
+    return {row.barcode: row.id for row in inserted}
+
+
+async def find_product_conflicts(db: AsyncSession, conflicted: List[tuple]) -> List[dict]:
+    """
+    Build add_products validation errors for (index, product) pairs the insert skipped
+    Only runs when a conflict happened, with one query for all skipped rows
+    """
+    barcodes = {product.barcode for _, product in conflicted}
+    skus = {product.sku for _, product in conflicted if product.sku}
+    existing_barcodes = set()
+    existing_skus = set()
+    existing_rows = await db.execute(
+        select(Products.barcode, Products.sku).where(
+            or_(Products.barcode.in_(barcodes), Products.sku.in_(skus))
+        )
+    )
+    for barcode, sku in existing_rows:
+        existing_barcodes.add(barcode)
+        if sku:
+            existing_skus.add(sku)
     
-    elif isinstance(e, AttributeError):
-        return {
-            "error": "AttributeError",
-            "message": "Invalid attribute or missing field in product data",
-            "type": "attribute_error",
-            "suggestion": "Please ensure all required fields are properly formatted"
-        }
+    errors = []
+    for idx, product in conflicted:
+        if product.barcode in existing_barcodes:
+            errors.append({
+                "product_index": idx,
+                "field": "barcode",
+                "value": product.barcode,
+                "error": f"Product with barcode '{product.barcode}' already exists",
+                "type": "duplicate_entry"
+            })
+        elif product.sku and product.sku in existing_skus:
+            errors.append({
+                "product_index": idx,
+                "field": "sku",
+                "value": product.sku,
+                "error": f"Product with SKU '{product.sku}' already exists",
+                "type": "duplicate_entry"
+            })
+        else:
+            errors.append({
+                "product_index": idx,
+                "error": "Product conflicts with an existing product",
+                "type": "duplicate_entry"
+            })
+    return errors
+
+
+def image_upload_error(e: Exception) -> HTTPException:
+    """Map a failed product image upload to the 400 (bad images) or 500 (storage) response"""
+    if isinstance(e, ValueError):
+        return HTTPException(
+            status_code=400,
+            detail={
+                "error": "ValidationError",
+                "message": str(e),
+                "field": "productimages",
+                "type": "max_limit_exceeded"
+            }
+        )
+    
+    error_message = str(e)
     
+    # Provide more specific error messages based on the error
+    if "invalid_grant" in error_message.lower() or "jwt" in error_message.lower():
+        detail_message = "GCS credentials are invalid or expired. Please regenerate service account key from Google Cloud Console."
+    elif "permission" in error_message.lower() or "403" in error_message:
+        detail_message = "Permission denied. Service account needs Storage Object Admin role."
+    elif "not found" in error_message.lower() or "404" in error_message:
+        detail_message = f"GCS bucket '{os.getenv('GCS_BUCKET_NAME')}' not found. Please check bucket name in .env file."
     else:
-        # Generic error handling
-        error_message = str(e) if str(e) else "An unexpected error occurred"
-        return {
-            "error": "InternalServerError",
-            "message": f"An unexpected error occurred while {context}" if context else error_message,
-            "type": "server_error",
-            "suggestion": "Please try again or contact support if the issue persists"
+        detail_message = f"Failed to upload images: {error_message}"
+    
+    return HTTPException(
+        status_code=500,
+        detail={
+            "error": "ImageUploadError",
+            "message": detail_message,
+            "type": "storage_error",
+            "raw_error": error_message
         }
+    )
+
+
+async def delete_uploaded_images(image_urls: List[str]):
+    """Best-effort removal of images uploaded for products that were not saved"""
+    if not image_urls or storage_service is None:
+        return
+    await asyncio.gather(
+        *(asyncio.to_thread(storage_service.delete_image, url) for url in image_urls)
+    )
 
 
 @router.post("/addProducts", response_model=List[ProductResponse], status_code=status.HTTP_201_CREATED)
-def add_products(
+async def add_products(
     products: List[ProductBase], 
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_role(["owner", "admin", "manager"]))
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(require_role_async(["owner", "admin", "manager"]))
 ):
     """
     Add new products - requires owner, admin, or manager role
@@ -148,7 +428,8 @@ def add_products(
     - productimages: Optional, max 5 images
     - All other fields: Optional with specific validations
     """
-    logging.info(f"User {current_user.name} adding {len(products)} product(s)")
+    logging.info("User %s adding %d product(s)", current_user.name, len(products))
+    business_id = current_user.business_key
     
     if not products:
         raise HTTPException(
@@ -161,221 +442,188 @@ def add_products(
             }
         )
     
+    check_batch_size(len(products), "products")
+    
+    # Images uploaded so far; removed again if the batch is not saved
+    uploaded_urls = []
+    
     try:
-        created_products = []
+        product_rows = []
         errors = []
         
+        # Reject duplicates within this batch before uploading any images; duplicates of
+        # existing products are caught by the unique indexes when inserting
+        seen_barcodes = set()
+        seen_skus = set()
         for idx, product in enumerate(products):
-            try:
-                # Debug: Log received product data
-                logging.info(f"Processing product {idx + 1}: {product.productname}")
-                logging.info(f"Product has images: {product.productimages is not None}")
-                if product.productimages:
-                    logging.info(f"Number of images: {len(product.productimages)}")
-                    logging.info(f"First image preview: {product.productimages[0][:100] if product.productimages[0] else 'None'}...")
-                
-                # Validate max 5 images
-                if product.productimages and len(product.productimages) > 5:
-                    raise HTTPException(
-                        status_code=400,
-                        detail={
-                            "error": "ValidationError",
-                            "message": "Maximum 5 images allowed per product",
-                            "field": "productimages",
-                            "type": "max_limit_exceeded",
-                            "current_count": len(product.productimages),
-                            "max_allowed": 5
-                        }
-                    )
-                
-                # Upload images to GCS if provided
-                uploaded_image_urls = []
-                if product.productimages and len(product.productimages) > 0:
-                    try:
-                        logging.info(f"Processing {len(product.productimages)} images for upload to GCS")
-                        
-                        if storage_service is None:
-                            raise HTTPException(
-                                status_code=500,
-                                detail={
-                                    "error": "StorageServiceError",
-                                    "message": "Google Cloud Storage is not configured. Check server logs for details.",
-                                    "type": "service_unavailable"
-                                }
-                            )
-                        
-                        uploaded_image_urls = storage_service.upload_product_images(
-                            product.productimages,
-                            max_images=5
-                        )
-                        logging.info(f"Successfully uploaded {len(uploaded_image_urls)} images to GCS products folder")
-                        logging.info(f"Image URLs: {uploaded_image_urls}")
-                    except ValueError as ve:
-                        raise HTTPException(
-                            status_code=400,
-                            detail={
-                                "error": "ValidationError",
-                                "message": str(ve),
-                                "field": "productimages",
-                                "type": "max_limit_exceeded"
-                            }
-                        )
-                    except Exception as e:
-                        logging.error(f"Error uploading images to GCS: {str(e)}")
-                        error_message = str(e)
-                        
-                        # Provide more specific error messages based on the error
-                        if "invalid_grant" in error_message.lower() or "jwt" in error_message.lower():
-                            detail_message = "GCS credentials are invalid or expired. Please regenerate service account key from Google Cloud Console."
-                        elif "permission" in error_message.lower() or "403" in error_message:
-                            detail_message = "Permission denied. Service account needs Storage Object Admin role."
-                        elif "not found" in error_message.lower() or "404" in error_message:
-                            detail_message = f"GCS bucket '{os.getenv('GCS_BUCKET_NAME')}' not found. Please check bucket name in .env file."
-                        else:
-                            detail_message = f"Failed to upload images: {error_message}"
-                        
-                        raise HTTPException(
-                            status_code=500,
-                            detail={
-                                "error": "ImageUploadError",
-                                "message": detail_message,
-                                "type": "storage_error",
-                                "raw_error": error_message
-                            }
-                        )
-                
-                # Check if product with same barcode already exists
-                existing_barcode = db.query(Products).filter(Products.barcode == product.barcode).first()
-                if existing_barcode:
-                    errors.append({
-                        "product_index": idx,
-                        "field": "barcode",
-                        "value": product.barcode,
-                        "error": f"Product with barcode '{product.barcode}' already exists",
-                        "type": "duplicate_entry"
-                    })
-                    continue
-                
-                # Check if product with same SKU already exists (if SKU provided)
-                if product.sku:
-                    existing_sku = db.query(Products).filter(Products.sku == product.sku).first()
-                    if existing_sku:
-                        errors.append({
-                            "product_index": idx,
-                            "field": "sku",
-                            "value": product.sku,
-                            "error": f"Product with SKU '{product.sku}' already exists",
-                            "type": "duplicate_entry"
-                        })
-                        continue
-                
-                # Create the product without productid (will be auto-generated after insert)
-                db_product = Products(
-                    business_id=str(current_user.business_id),
-                    productid=None,  # Will be set after getting auto-generated ID
-                    productname=product.productname,
-                    barcode=product.barcode,
-                    sku=product.sku,
-                    description=product.description,
-                    brand=product.brand,
-                    category=product.category,
-                    productimages=uploaded_image_urls if uploaded_image_urls else None,  # Use GCS URLs
-                    price=product.price,
-                    unitvalue=product.unitvalue,
-                    unit=product.unit,
-                    discount=product.discount,
-                    gst=product.gst,
-                    openingstock=product.openingstock,
-                    quantity=product.openingstock if product.openingstock else 0,  # Set quantity to openingstock
-                    mfgdate=product.mfgdate,
-                    expirydate=product.expirydate,
-                    suppliername=product.suppliername,
-                    suppliercontact=product.suppliercontact,
-                    customfields=product.customfields,
-                    updated_by=current_user.name
-                )
-                db.add(db_product)
-                db.flush()  # Flush to get the auto-generated id
-                
-                # Set productid as PRD{id} after getting auto-generated ID
-                db_product.productid = f"PRD{db_product.id}"
-                db.flush()  # Update with formatted productid
-                
-                created_products.append(db_product)
-                
-            except IntegrityError as ie:
-                db.rollback()
-                error_msg = str(ie.orig)
-                
-                # Parse specific database constraint errors
-                if "unique constraint" in error_msg.lower() or "duplicate key" in error_msg.lower():
-                    if "productid" in error_msg.lower():
-                        field = "productid"
-                        message = f"Product ID '{product.productid}' already exists"
-                    elif "barcode" in error_msg.lower():
-                        field = "barcode"
-                        message = f"Barcode '{product.barcode}' already exists"
-                    elif "sku" in error_msg.lower():
-                        field = "sku"
-                        message = f"SKU '{product.sku}' already exists"
-                    else:
-                        field = "unknown"
-                        message = "Duplicate entry detected"
-                    
-                    errors.append({
-                        "product_index": idx,
-                        "field": field,
-                        "value": getattr(product, field, "N/A"),
-                        "error": message,
-                        "type": "database_constraint"
-                    })
-                elif "not null" in error_msg.lower():
-                    errors.append({
-                        "product_index": idx,
-                        "field": "unknown",
-                        "error": "Required field is missing",
-                        "type": "missing_required_field",
-                        "details": error_msg
-                    })
-                else:
-                    errors.append({
-                        "product_index": idx,
-                        "error": "Database error occurred",
-                        "type": "database_error",
-                        "details": error_msg
-                    })
-                continue
+            if product.barcode in seen_barcodes:
+                errors.append({
+                    "product_index": idx,
+                    "field": "barcode",
+                    "value": product.barcode,
+                    "error": f"Barcode '{product.barcode}' is used by more than one product in this request",
+                    "type": "duplicate_entry"
+                })
+            elif product.sku and product.sku in seen_skus:
+                errors.append({
+                    "product_index": idx,
+                    "field": "sku",
+                    "value": product.sku,
+                    "error": f"SKU '{product.sku}' is used by more than one product in this request",
+                    "type": "duplicate_entry"
+                })
+            seen_barcodes.add(product.barcode)
+            if product.sku:
+                seen_skus.add(product.sku)
         
-        # If there are errors, rollback and return them
         if errors:
-            db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "error": "ProductValidationError",
                     "message": f"Failed to add {len(errors)} out of {len(products)} product(s)",
-                    "successful_count": len(created_products),
+                    "successful_count": len(products) - len(errors),
                     "failed_count": len(errors),
                     "validation_errors": errors
                 }
             )
         
-        # Commit all successful products
-        db.commit()
+        for idx, product in enumerate(products):
+            # Validate max 5 images
+            if product.productimages and len(product.productimages) > 5:
+                raise HTTPException(
+                    status_code=400,
+                    detail={
+                        "error": "ValidationError",
+                        "message": "Maximum 5 images allowed per product",
+                        "field": "productimages",
+                        "type": "max_limit_exceeded",
+                        "current_count": len(product.productimages),
+                        "max_allowed": 5
+                    }
+                )
+            
+            # Upload images to GCS if provided
+            uploaded_image_urls = []
+            if product.productimages and len(product.productimages) > 0:
+                try:
+                    logging.debug("Uploading %d images for product %s", len(product.productimages), idx + 1)
+                    
+                    if storage_service is None:
+                        raise HTTPException(
+                            status_code=500,
+                            detail={
+                                "error": "StorageServiceError",
+                                "message": "Google Cloud Storage is not configured. Check server logs for details.",
+                                "type": "service_unavailable"
+                            }
+                        )
+                    
+                    uploaded_image_urls = await storage_service.upload_product_images_async(
+                        product.productimages,
+                        max_images=5
+                    )
+                    logging.debug("Image URLs: %s", uploaded_image_urls)
+                    uploaded_urls.extend(uploaded_image_urls)
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    logging.error("Error uploading images to GCS: %s", e)
+                    raise image_upload_error(e)
+            
+            # Productid is filled in as PRD{id} once the ids are known
+            product_rows.append({
+                "business_id": business_id,
+                "productid": None,
+                "productname": product.productname,
+                "barcode": product.barcode,
+                "sku": product.sku,
+                "description": product.description,
+                "brand": product.brand,
+                "category": product.category,
+                "productimages": uploaded_image_urls if uploaded_image_urls else None,  # Use GCS URLs
+                "price": product.price,
+                "unitvalue": product.unitvalue,
+                "unit": product.unit,
+                "discount": product.discount,
+                "gst": product.gst,
+                "openingstock": product.openingstock,
+                "quantity": product.openingstock if product.openingstock else 0,  # Set quantity to openingstock
+                "mfgdate": product.mfgdate,
+                "expirydate": product.expirydate,
+                "suppliername": product.suppliername,
+                "suppliercontact": product.suppliercontact,
+                "customfields": product.customfields,
+                "updated_by": current_user.name
+            })
+        
+        try:
+            if len(product_rows) >= COPY_THRESHOLD:
+                # Large imports: stream the rows with COPY instead of INSERT
+                inserted = await copy_insert_products(db, product_rows)
+            else:
+                # Insert the whole batch in one statement; rows whose barcode/SKU already
+                # exist are skipped by the unique indexes instead of being checked up front
+                result = await db.execute(
+                    pg_insert(Products).on_conflict_do_nothing().returning(Products.id, Products.barcode),
+                    product_rows
+                )
+                inserted = {row.barcode: row.id for row in result}
+            
+            if len(inserted) < len(product_rows):
+                # Some rows conflicted: work out which ones and why, then reject the batch
+                errors = await find_product_conflicts(
+                    db, [(idx, product) for idx, product in enumerate(products) if product.barcode not in inserted]
+                )
+                await db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail={
+                        "error": "ProductValidationError",
+                        "message": f"Failed to add {len(errors)} out of {len(products)} product(s)",
+                        "successful_count": len(products) - len(errors),
+                        "failed_count": len(errors),
+                        "validation_errors": errors
+                    }
+                )
+            
+            # ids in the same order as the submitted products
+            inserted_ids = [inserted[row["barcode"]] for row in product_rows]
+            
+            # Set productid as PRD{id} for the whole batch and read back the final rows
+            result = await db.execute(
+                update(Products)
+                .where(Products.id.in_(inserted_ids))
+                .values(productid=func.concat("PRD", Products.id))
+                .returning(*PRODUCT_RESPONSE_COLUMNS)
+                .execution_options(synchronize_session=False)
+            )
+            updated_rows = result.all()
+        except IntegrityError as ie:
+            # Unique conflicts are skipped above, so this is another constraint (e.g. NOT NULL)
+            await db.rollback()
+            logging.warning("Constraint violation adding products: %s", ie.orig)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=parse_exception_to_error_detail(ie, "adding products")
+            )
+        
+        await db.commit()
         
-        # Refresh all products to get the final timestamps
-        for p in created_products:
-            db.refresh(p)
+        rows_by_id = {row.id: row for row in updated_rows}
+        created_products = [product_response(rows_by_id[product_id]) for product_id in inserted_ids]
         
-        logging.info(f"Successfully added {len(created_products)} product(s)")
+        logging.info("Successfully added %d product(s)", len(created_products))
         return created_products
         
     except HTTPException:
-        # Re-raise HTTPException as is
+        # Re-raise HTTPException as is, after removing images of the unsaved batch
+        await delete_uploaded_images(uploaded_urls)
         raise
     except Exception as e:
-        db.rollback()
-        logging.error(f"Unexpected error adding products: {str(e)}", exc_info=True)
+        await db.rollback()
+        await delete_uploaded_images(uploaded_urls)
+        logging.error("Unexpected error adding products: %s", e, exc_info=True)
         error_detail = parse_exception_to_error_detail(e, "adding products")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -383,12 +631,34 @@ def add_products(
         )
 
 
-@router.get("/getProducts")
-def get_products(
+STREAM_BATCH_SIZE = 1000
+
+
+async def stream_products_ndjson(business_id: str):
+    """
+    Yield a business's products as NDJSON lines, fetched from a server-side cursor in batches
+    
+    Uses its own session because request-scoped dependencies are closed before a
+    streaming body is sent.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            select(*PRODUCT_RESPONSE_COLUMNS)
+            .where(Products.business_id == business_id)
+            .order_by(Products.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for row in result:
+            yield product_response(row, ProductListItem).model_dump_json() + "\n"
+
+
+@router.get("/getProducts", response_model=ProductListResponse)
+async def get_products(
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(get_current_employee)
+    stream: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(get_current_employee_async)
 ):
     """
     Get all products with pagination - requires authentication (all roles can view)
@@ -397,56 +667,34 @@ def get_products(
     Parameters:
     - skip: Number of records to skip (for pagination)
     - limit: Number of records to return (max per page)
+    - stream: Stream every product of the business as NDJSON, ignoring skip/limit
     """
-    logging.info(f"User {current_user.name} fetching products (skip={skip}, limit={limit})")
+    logging.info("User %s fetching products (skip=%s, limit=%s, stream=%s)", current_user.name, skip, limit, stream)
+    business_id = current_user.business_key
+    
+    if stream:
+        return StreamingResponse(stream_products_ndjson(business_id), media_type="application/x-ndjson")
+    
     try:
-        # Filter by business_id
-        query = db.query(Products).filter(Products.business_id == str(current_user.business_id))
-        
         # Get total count
-        total = query.count()
-        
-        # Get paginated products
-        products = query.offset(skip).limit(limit).all()
+        total = await db.scalar(
+            select(func.count(Products.id)).where(Products.business_id == business_id)
+        )
         
-        # Convert to response format
-        products_list = []
-        for product in products:
-            product_dict = {
-                "id": product.id,
-                "productid": product.productid if product.productid else f"PRD{product.id}",
-                "productname": product.productname,
-                "barcode": product.barcode,
-                "sku": product.sku,
-                "description": product.description,
-                "brand": product.brand,
-                "category": product.category,
-                "productimages": product.productimages,
-                "price": product.price,
-                "unitvalue": product.unitvalue,
-                "unit": product.unit,
-                "discount": product.discount,
-                "gst": product.gst,
-                "quantity": product.quantity,
-                "openingstock": product.openingstock,
-                "mfgdate": product.mfgdate,
-                "expirydate": product.expirydate,
-                "suppliername": product.suppliername,
-                "suppliercontact": product.suppliercontact,
-                "customfields": product.customfields,
-                "created_at": product.created_at,
-                "updated_at": product.updated_at
-            }
-            products_list.append(product_dict)
+        # Get paginated products, filtered by business_id
+        result = await db.execute(
+            select(*PRODUCT_RESPONSE_COLUMNS).where(Products.business_id == business_id).offset(skip).limit(limit)
+        )
+        products_list = [product_response(row, ProductListItem) for row in result]
         
-        return {
-            "items": products_list,
-            "total": total,
-            "skip": skip,
-            "limit": limit
-        }
+        return ProductListResponse.model_construct(
+            items=products_list,
+            total=total,
+            skip=skip,
+            limit=limit
+        )
     except Exception as e:
-        logging.error(f"Error fetching products: {str(e)}", exc_info=True)
+        logging.error("Error fetching products: %s", e, exc_info=True)
         error_detail = parse_exception_to_error_detail(e, "fetching products")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -455,21 +703,25 @@ def get_products(
 
 
 @router.get("/getProduct/{product_id}", response_model=ProductResponse)
-def get_product_by_id(
+async def get_product_by_id(
     product_id: int,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(get_current_employee)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(get_current_employee_async)
 ):
     """
     Get a single product by ID - requires authentication
     Used for populating edit form with product details
     """
-    logging.info(f"User {current_user.name} fetching product ID {product_id}")
+    logging.info("User %s fetching product ID %s", current_user.name, product_id)
+    business_id = current_user.business_key
     try:
-        product = db.query(Products).filter(
-            Products.id == product_id,
-            Products.business_id == str(current_user.business_id)
-        ).first()
+        result = await db.execute(
+            select(Products).where(
+                Products.id == product_id,
+                Products.business_id == business_id
+            )
+        )
+        product = result.scalar_one_or_none()
         if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -479,11 +731,11 @@ def get_product_by_id(
                     "type": "not_found"
                 }
             )
-        return product
+        return product_response(product)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching product ID {product_id}: {str(e)}", exc_info=True)
+        logging.error("Error fetching product ID %s: %s", product_id, e, exc_info=True)
         error_detail = parse_exception_to_error_detail(e, f"fetching product with ID {product_id}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -492,21 +744,25 @@ def get_product_by_id(
 
 
 @router.get("/getProductByProductId/{productid}", response_model=ProductResponse)
-def get_product_by_productid(
+async def get_product_by_productid(
     productid: str,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(get_current_employee)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(get_current_employee_async)
 ):
     """
     Get a single product by productid - requires authentication
     Used for searching/filtering products by productid
     """
-    logging.info(f"User {current_user.name} fetching product with productid {productid}")
+    logging.info("User %s fetching product with productid %s", current_user.name, productid)
+    business_id = current_user.business_key
     try:
-        product = db.query(Products).filter(
-            Products.productid == productid,
-            Products.business_id == str(current_user.business_id)
-        ).first()
+        result = await db.execute(
+            select(Products).where(
+                Products.productid == productid,
+                Products.business_id == business_id
+            )
+        )
+        product = result.scalar_one_or_none()
         if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -516,11 +772,11 @@ def get_product_by_productid(
                     "type": "not_found"
                 }
             )
-        return product
+        return product_response(product)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching product productid {productid}: {str(e)}", exc_info=True)
+        logging.error("Error fetching product productid %s: %s", productid, e, exc_info=True)
         error_detail = parse_exception_to_error_detail(e, f"fetching product with productid '{productid}'")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -529,24 +785,32 @@ def get_product_by_productid(
 
 
 @router.put("/updateProduct/{product_id}", response_model=ProductResponse)
-def update_product(
+async def update_product(
     product_id: int,
     product_data: ProductUpdate,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_role(["owner", "admin", "manager"]))
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(require_role_async(["owner", "admin", "manager"]))
 ):
     """
     Update a product by ID - requires owner, admin, or manager role
     All fields are optional - only provided fields will be updated
     Used when editing a product from the product card/form
+    
+    New base64 images are uploaded to GCS before the product is saved, so a bad image
+    or a storage failure is reported in the response instead of being lost
     """
-    logging.info(f"User {current_user.name} updating product ID {product_id}")
+    logging.info("User %s updating product ID %s", current_user.name, product_id)
+    business_id = current_user.business_key
+    uploaded_urls = []
     
     try:
-        product = db.query(Products).filter(
-            Products.id == product_id,
-            Products.business_id == str(current_user.business_id)
-        ).first()
+        result = await db.execute(
+            select(Products).where(
+                Products.id == product_id,
+                Products.business_id == business_id
+            )
+        )
+        product = result.scalar_one_or_none()
         if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -570,40 +834,6 @@ def update_product(
                 }
             )
         
-        # Check for duplicate barcode if it's being updated
-        if "barcode" in update_dict and update_dict["barcode"] != product.barcode:
-            existing = db.query(Products).filter(
-                Products.barcode == update_dict["barcode"],
-                Products.id != product_id
-            ).first()
-            if existing:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "error": "DuplicateEntryError",
-                        "message": f"Product with barcode '{update_dict['barcode']}' already exists",
-                        "field": "barcode",
-                        "type": "duplicate_entry"
-                    }
-                )
-        
-        # Check for duplicate SKU if it's being updated
-        if "sku" in update_dict and update_dict["sku"] and update_dict["sku"] != product.sku:
-            existing = db.query(Products).filter(
-                Products.sku == update_dict["sku"],
-                Products.id != product_id
-            ).first()
-            if existing:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "error": "DuplicateEntryError",
-                        "message": f"Product with SKU '{update_dict['sku']}' already exists",
-                        "field": "sku",
-                        "type": "duplicate_entry"
-                    }
-                )
-        
         # Handle image uploads if productimages are provided
         if "productimages" in update_dict and update_dict["productimages"]:
             images = update_dict["productimages"]
@@ -636,64 +866,30 @@ def update_product(
             
             # Upload new base64 images to GCS
             if images_to_upload:
-                try:
-                    logging.info(f"Processing {len(images_to_upload)} new images for upload to GCS")
-                    
-                    if storage_service is None:
-                        raise HTTPException(
-                            status_code=500,
-                            detail={
-                                "error": "StorageServiceError",
-                                "message": "Google Cloud Storage is not configured. Check server logs for details.",
-                                "type": "service_unavailable"
-                            }
-                        )
-                    
-                    uploaded_urls = storage_service.upload_product_images(
-                        images_to_upload,
-                        max_images=5
-                    )
-                    logging.info(f"Successfully uploaded {len(uploaded_urls)} images to GCS products folder")
-                    
-                    # Combine existing URLs and newly uploaded URLs
-                    update_dict["productimages"] = existing_urls + uploaded_urls
-                    
-                except ValueError as ve:
-                    raise HTTPException(
-                        status_code=400,
-                        detail={
-                            "error": "ValidationError",
-                            "message": str(ve),
-                            "field": "productimages",
-                            "type": "max_limit_exceeded"
-                        }
-                    )
-                except Exception as e:
-                    logging.error(f"Error uploading images to GCS: {str(e)}")
-                    error_message = str(e)
-                    
-                    # Provide more specific error messages based on the error
-                    if "invalid_grant" in error_message.lower() or "jwt" in error_message.lower():
-                        detail_message = "GCS credentials are invalid or expired. Please regenerate service account key from Google Cloud Console."
-                    elif "permission" in error_message.lower() or "403" in error_message:
-                        detail_message = "Permission denied. Service account needs Storage Object Admin role."
-                    elif "not found" in error_message.lower() or "404" in error_message:
-                        detail_message = f"GCS bucket '{os.getenv('GCS_BUCKET_NAME')}' not found. Please check bucket name in .env file."
-                    else:
-                        detail_message = f"Failed to upload images: {error_message}"
-                    
+                logging.info("Processing %d new images for upload to GCS", len(images_to_upload))
+                
+                if storage_service is None:
                     raise HTTPException(
                         status_code=500,
                         detail={
-                            "error": "ImageUploadError",
-                            "message": detail_message,
-                            "type": "storage_error",
-                            "raw_error": error_message
+                            "error": "StorageServiceError",
+                            "message": "Google Cloud Storage is not configured. Check server logs for details.",
+                            "type": "service_unavailable"
                         }
                     )
-            else:
-                # Only existing URLs, no upload needed
-                update_dict["productimages"] = existing_urls
+                
+                try:
+                    uploaded_urls = await storage_service.upload_product_images_async(
+                        images_to_upload,
+                        max_images=5
+                    )
+                except Exception as e:
+                    logging.error("Error uploading images to GCS: %s", e)
+                    raise image_upload_error(e)
+                logging.info("Successfully uploaded %d images to GCS products folder", len(uploaded_urls))
+            
+            # Combine existing URLs and newly uploaded URLs
+            update_dict["productimages"] = existing_urls + uploaded_urls
         
         # Update fields
         for key, value in update_dict.items():
@@ -701,17 +897,39 @@ def update_product(
         
         product.updated_by = current_user.name
         
-        db.commit()
-        db.refresh(product)
+        # A barcode/SKU already used by another product is caught by the unique indexes
+        try:
+            await db.commit()
+        except IntegrityError as ie:
+            await db.rollback()
+            field = _duplicate_field(ie)
+            if field is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=parse_exception_to_error_detail(ie, f"updating product with ID {product_id}")
+                )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "DuplicateEntryError",
+                    "message": f"Product with {FIELD_LABELS[field]} '{update_dict.get(field)}' already exists",
+                    "field": field,
+                    "type": "duplicate_entry"
+                }
+            )
+        await db.refresh(product)
         
-        logging.info(f"Product ID {product_id} updated successfully")
-        return product
+        logging.info("Product ID %s updated successfully", product_id)
+        return product_response(product)
         
     except HTTPException:
+        # Images uploaded for an update that was not saved
+        await delete_uploaded_images(uploaded_urls)
         raise
     except Exception as e:
-        db.rollback()
-        logging.error(f"Error updating product ID {product_id}: {str(e)}", exc_info=True)
+        await db.rollback()
+        await delete_uploaded_images(uploaded_urls)
+        logging.error("Error updating product ID %s: %s", product_id, e, exc_info=True)
         error_detail = parse_exception_to_error_detail(e, f"updating product with ID {product_id}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -719,24 +937,32 @@ def update_product(
         )
 
 
-@router.delete("/deleteProduct/{product_id}", status_code=status.HTTP_200_OK)
-def delete_product(
+@router.delete("/deleteProduct/{product_id}", response_model=ProductDeleteResponse, status_code=status.HTTP_200_OK)
+async def delete_product(
     product_id: int,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_role(["owner", "admin", "manager"]))
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(require_role_async(["owner", "admin", "manager"]))
 ):
     """
     Delete a product by ID - requires owner, admin, or manager role
     Used when deleting a product from the product card
     """
-    logging.info(f"User {current_user.name} deleting product ID {product_id}")
+    logging.info("User %s deleting product ID %s", current_user.name, product_id)
+    business_id = current_user.business_key
     
     try:
-        product = db.query(Products).filter(
-            Products.id == product_id,
-            Products.business_id == str(current_user.business_id)
-        ).first()
-        if not product:
+        # Single DELETE ... RETURNING instead of loading the row first
+        result = await db.execute(
+            delete(Products)
+            .where(
+                Products.id == product_id,
+                Products.business_id == business_id
+            )
+            .returning(Products.id, Products.productid, Products.productname)
+            .execution_options(synchronize_session=False)  # nothing loaded in the session to sync
+        )
+        deleted = result.first()
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -747,15 +973,14 @@ def delete_product(
             )
         
         product_info = {
-            "id": product.id,
-            "productid": product.productid,
-            "productname": product.productname
+            "id": deleted.id,
+            "productid": deleted.productid,
+            "productname": deleted.productname
         }
         
-        db.delete(product)
-        db.commit()
+        await db.commit()
         
-        logging.info(f"Product ID {product_id} deleted successfully")
+        logging.info("Product ID %s deleted successfully", product_id)
         return {
             "status": "success",
             "message": f"Product deleted successfully",
@@ -765,8 +990,8 @@ def delete_product(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
-        logging.error(f"Error deleting product ID {product_id}: {str(e)}", exc_info=True)
+        await db.rollback()
+        logging.error("Error deleting product ID %s: %s", product_id, e, exc_info=True)
         error_detail = parse_exception_to_error_detail(e, f"deleting product with ID {product_id}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -774,11 +999,11 @@ def delete_product(
         )
 
 
-@router.delete("/deleteProducts", status_code=status.HTTP_200_OK)
-def delete_products_bulk(
+@router.delete("/deleteProducts", response_model=ProductBulkDeleteResponse, response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def delete_products_bulk(
     product_ids: List[int],
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_role(["owner", "admin", "manager"]))
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(require_role_async(["owner", "admin", "manager"]))
 ):
     """
     Bulk delete products by IDs - requires owner, admin, or manager role
@@ -786,7 +1011,8 @@ def delete_products_bulk(
     Request format: [1, 2, 3, 4, 5]
     Returns detailed results for each product with success/failure status
     """
-    logging.info(f"User {current_user.name} bulk deleting {len(product_ids)} product(s)")
+    logging.info("User %s bulk deleting %d product(s)", current_user.name, len(product_ids))
+    business_id = current_user.business_key
     
     if not product_ids:
         raise HTTPException(
@@ -798,59 +1024,82 @@ def delete_products_bulk(
             }
         )
     
+    check_batch_size(len(product_ids), "product IDs")
+    
     results = []
     successful_count = 0
     failed_count = 0
     
+    # Each id is deleted once; repeats are reported without touching the database
+    unique_ids = list(dict.fromkeys(product_ids))
+    
+    try:
+        # Delete every matching product in a single statement and get back what was removed
+        result = await db.execute(
+            delete(Products)
+            .where(
+                Products.id.in_(unique_ids),
+                Products.business_id == business_id
+            )
+            .returning(Products.id, Products.productid, Products.productname)
+            .execution_options(synchronize_session=False)  # nothing loaded in the session to sync
+        )
+        deleted_rows = result.all()
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logging.error("Error bulk deleting products: %s", e, exc_info=True)
+        error_detail = parse_exception_to_error_detail(e, "deleting products")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=error_detail
+        )
+    
+    deleted_by_id = {
+        row.id: {
+            "id": row.id,
+            "productid": row.productid,
+            "productname": row.productname
+        }
+        for row in deleted_rows
+    }
+    
+    seen_ids = set()
     for idx, product_id in enumerate(product_ids):
-        try:
-            product = db.query(Products).filter(
-                Products.id == product_id,
-                Products.business_id == str(current_user.business_id)
-            ).first()
-            if not product:
-                results.append({
-                    "product_index": idx,
-                    "product_id": product_id,
-                    "status": "failed",
-                    "error": f"Product with ID {product_id} not found",
-                    "type": "not_found"
-                })
-                failed_count += 1
-                continue
-            
-            product_info = {
-                "id": product.id,
-                "productid": product.productid,
-                "productname": product.productname
-            }
-            
-            db.delete(product)
-            db.commit()
-            
+        if product_id in seen_ids:
             results.append({
                 "product_index": idx,
                 "product_id": product_id,
-                "status": "success",
-                "message": f"Product '{product_info['productname']}' deleted successfully",
-                "deleted_product": product_info
+                "status": "failed",
+                "error": f"Product ID {product_id} appears more than once in this request",
+                "type": "duplicate_in_payload"
             })
-            successful_count += 1
-            
-        except Exception as e:
-            db.rollback()
-            error_detail = parse_exception_to_error_detail(e, f"deleting product with ID {product_id}")
+            failed_count += 1
+            continue
+        seen_ids.add(product_id)
+        
+        product_info = deleted_by_id.get(product_id)
+        if not product_info:
             results.append({
                 "product_index": idx,
                 "product_id": product_id,
                 "status": "failed",
-                "error": error_detail.get("message", "Deletion failed"),
-                "error_details": error_detail,
-                "type": error_detail.get("type", "server_error")
+                "error": f"Product with ID {product_id} not found",
+                "type": "not_found"
             })
             failed_count += 1
+            continue
+        
+        results.append({
+            "product_index": idx,
+            "product_id": product_id,
+            "status": "success",
+            "message": f"Product '{product_info['productname']}' deleted successfully",
+            "deleted_product": product_info
+        })
+        successful_count += 1
     
-    logging.info(f"Bulk delete completed: {successful_count} successful, {failed_count} failed")
+    logging.info("Bulk delete completed: %s successful, %s failed", successful_count, failed_count)
     
     return {
         "summary": {
@@ -862,15 +1111,69 @@ def delete_products_bulk(
     }
 
 
-@router.get("/searchProducts", response_model=List[ProductResponse])
-def search_products(
+def build_product_search_query(
+    business_id: str,
+    query: Optional[str] = None,
+    category: Optional[str] = None,
+    brand: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None
+):
+    """
+    Build the filtered products query used by /searchProducts (no ordering or paging)
+    Selects only the columns returned in ProductResponse
+    """
+    # Filter by business_id first
+    products_query = select(*PRODUCT_RESPONSE_COLUMNS).where(Products.business_id == business_id)
+    
+    # Search in multiple fields
+    if query:
+        # Identifier fields are matched as substrings (barcode fragments etc.)
+        # through ILIKE, which the pg_trgm GIN indexes serve
+        search_term = f"%{query}%"
+        search_filter = (
+            (Products.productid.ilike(search_term)) |
+            (Products.barcode.ilike(search_term)) |
+            (Products.sku.ilike(search_term))
+        )
+        ts_query = build_prefix_tsquery(query)
+        if ts_query:
+            # Product names are matched word by word through the search_vector GIN index
+            search_filter = search_filter | Products.search_vector.op("@@")(func.to_tsquery("simple", ts_query))
+        else:
+            # Only punctuation/symbols were given - nothing to tokenise
+            search_filter = search_filter | Products.productname.ilike(search_term)
+        products_query = products_query.where(search_filter)
+    
+    # Filter by category
+    if category:
+        products_query = products_query.where(Products.category.ilike(f"%{category}%"))
+    
+    # Filter by brand
+    if brand:
+        products_query = products_query.where(Products.brand.ilike(f"%{brand}%"))
+    
+    # Filter by price range
+    if min_price is not None:
+        products_query = products_query.where(Products.price >= min_price)
+    if max_price is not None:
+        products_query = products_query.where(Products.price <= max_price)
+    
+    return products_query
+
+
+@router.get("/searchProducts", response_model=ProductSearchResponse, response_model_exclude_unset=True)
+async def search_products(
     query: Optional[str] = None,
     category: Optional[str] = None,
     brand: Optional[str] = None,
     min_price: Optional[float] = None,
     max_price: Optional[float] = None,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(get_current_employee)
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(get_current_employee_async)
 ):
     """
     Search and filter products - requires authentication
@@ -881,42 +1184,49 @@ def search_products(
     - brand: Filter by brand
     - min_price: Minimum price filter
     - max_price: Maximum price filter
+    - limit: Number of products per page (1-200, default 50)
+    - cursor: next_cursor from the previous page to continue from
+    - include_total: Also count every match and return it as total (off by default)
+    
+    Returns {"items": [...], "total": n, "next_cursor": "..."}; next_cursor is null on the last page
+    and total is only present when include_total is true
     """
-    logging.info(f"User {current_user.name} searching products with filters")
+    logging.info("User %s searching products with filters", current_user.name)
+    business_id = current_user.business_key
     
     try:
-        # Filter by business_id first
-        products_query = db.query(Products).filter(Products.business_id == str(current_user.business_id))
+        products_query = build_product_search_query(
+            business_id, query, category, brand, min_price, max_price
+        )
         
-        # Search in multiple fields
-        if query:
-            search_term = f"%{query}%"
-            products_query = products_query.filter(
-                (Products.productname.ilike(search_term)) |
-                (Products.productid.ilike(search_term)) |
-                (Products.barcode.ilike(search_term)) |
-                (Products.sku.ilike(search_term))
-            )
+        # Total matches for the whole search, counted server-side only on request
+        page = {}
+        if include_total:
+            page["total"] = await db.scalar(products_query.with_only_columns(func.count(Products.id)))
         
-        # Filter by category
-        if category:
-            products_query = products_query.filter(Products.category.ilike(f"%{category}%"))
+        # Keyset pagination: continue after the last id of the previous page
+        if cursor:
+            products_query = products_query.where(Products.id > decode_cursor(cursor))
         
-        # Filter by brand
-        if brand:
-            products_query = products_query.filter(Products.brand.ilike(f"%{brand}%"))
+        # Fetch one extra row to know whether another page exists
+        result = await db.execute(products_query.order_by(Products.id).limit(limit + 1))
+        products = result.all()
         
-        # Filter by price range
-        if min_price is not None:
-            products_query = products_query.filter(Products.price >= min_price)
-        if max_price is not None:
-            products_query = products_query.filter(Products.price <= max_price)
+        next_cursor = None
+        if len(products) > limit:
+            products = products[:limit]
+            next_cursor = encode_cursor(products[-1].id)
         
-        products = products_query.all()
-        return products
+        return ProductSearchResponse.model_construct(
+            items=[product_response(row) for row in products],
+            next_cursor=next_cursor,
+            **page
+        )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logging.error(f"Error searching products: {str(e)}", exc_info=True)
+        logging.error("Error searching products: %s", e, exc_info=True)
         error_detail = parse_exception_to_error_detail(e, "searching products")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,25 +1,193 @@
+import base64
+import binascii
+import hashlib
+import json
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import delete, exists, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
-from app.database import get_db
-from app.models.stores import Store
+from app.database import get_async_db
+from app.models.stores import Store, BusinessStoreCounter
 from app.models.business import Business
 from app.models.employees import Employee
-from app.schemas.stores import StoreCreate, StoreResponse, StoreUpdate
-from app.core.dependencies import get_current_employee, require_role
+from app.schemas.stores import StoreCreate, StoreListResponse, StoreResponse, StoreUpdate
+from app.core.dependencies import get_current_employee_async, require_role_async
 
 router = APIRouter(tags=["stores"])
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# In-memory unfiltered store counts per business
+# Format: {business_id: (count, expires_at)} with expires_at on the time.monotonic() clock
+store_count_cache: Dict[str, Tuple[int, float]] = {}
+
+# How long a cached store count is served before it is recounted
+STORE_COUNT_TTL_SECONDS = 60
+
+
+async def get_store_count(db: AsyncSession, business_id: str) -> int:
+    """Return the number of stores in a business, cached for STORE_COUNT_TTL_SECONDS"""
+    cached = store_count_cache.get(business_id)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    
+    count = await db.scalar(select(func.count(Store.id)).where(Store.business_id == business_id))
+    store_count_cache[business_id] = (count, time.monotonic() + STORE_COUNT_TTL_SECONDS)
+    return count
+
+
+def invalidate_store_count(business_id: str):
+    store_count_cache.pop(business_id, None)
+
+
+# Businesses known to exist, as {business_id: expires_at} on the time.monotonic() clock
+# Only hits are cached so a newly registered business is seen immediately
+business_exists_cache: Dict[str, float] = {}
+
+# How long a confirmed business is trusted before it is checked again
+BUSINESS_EXISTS_TTL_SECONDS = 300
+
+
+async def business_exists(db: AsyncSession, business_id: str) -> bool:
+    """Return whether the business profile exists, caching positive answers"""
+    expires_at = business_exists_cache.get(business_id)
+    if expires_at and expires_at > time.monotonic():
+        return True
+    
+    found = await db.scalar(select(exists().where(Business.business_id == business_id)))
+    if found:
+        business_exists_cache[business_id] = time.monotonic() + BUSINESS_EXISTS_TTL_SECONDS
+    return found
+
+
+async def next_store_sequence(db: AsyncSession, business_id: str) -> int:
+    """
+    Atomically reserve the next store_sequence for a business
+    
+    The counter row is locked until the caller commits or rolls back. On first use it is
+    seeded from the highest existing store_sequence of the business.
+    """
+    seed = select(
+        func.coalesce(func.max(Store.store_sequence), 0) + 1
+    ).where(Store.business_id == business_id).scalar_subquery()
+    
+    statement = pg_insert(BusinessStoreCounter).values(
+        business_id=business_id,
+        last_sequence=seed
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[BusinessStoreCounter.business_id],
+        set_={"last_sequence": BusinessStoreCounter.last_sequence + 1}
+    ).returning(BusinessStoreCounter.last_sequence)
+    
+    return (await db.execute(statement)).scalar_one()
+
+
+def encode_store_cursor(store) -> str:
+    """Encode the last seen (store_sequence, id) as an opaque base64url cursor"""
+    return base64.urlsafe_b64encode(f"{store.store_sequence}:{store.id}".encode()).decode()
+
+
+def decode_store_cursor(cursor: str) -> tuple:
+    """Decode a cursor produced by encode_store_cursor back into (store_sequence, id)"""
+    try:
+        sequence, store_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        return int(sequence), int(store_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor."
+        )
+
+# Columns needed to build a StoreResponse, so the list endpoint can skip ORM hydration
+STORE_RESPONSE_COLUMNS = [getattr(Store, field) for field in StoreResponse.model_fields]
+
+
+def store_response(source) -> StoreResponse:
+    """Build a StoreResponse from a STORE_RESPONSE_COLUMNS row or a Store without re-validating database values"""
+    return StoreResponse.model_construct(**{field: getattr(source, field) for field in StoreResponse.model_fields})
+
+
+# Serialized single-store responses, tagged with the store's updated_at (or created_at)
+# so every worker can check an entry against the database before serving it
+# Format: {(business_id, store_id): (expires_at, version, etag, json_body)} on the time.monotonic() clock
+store_response_cache: Dict[Tuple[str, int], Tuple[float, datetime, str, str]] = {}
+
+# How long a serialized store is served before it is reloaded, and how many are kept
+STORE_RESPONSE_TTL_SECONDS = 60
+STORE_RESPONSE_CACHE_SIZE = 10000
+
+
+def cache_store_response(business_id: str, store_id: int, version: datetime, etag: str, body: str):
+    if len(store_response_cache) >= STORE_RESPONSE_CACHE_SIZE:
+        # Evict the oldest entry; dicts keep insertion order
+        store_response_cache.pop(next(iter(store_response_cache)))
+    store_response_cache[(business_id, store_id)] = (
+        time.monotonic() + STORE_RESPONSE_TTL_SECONDS, version, etag, body
+    )
+
+
+def invalidate_store_response(business_id: str, store_id: int):
+    store_response_cache.pop((business_id, store_id), None)
+
+
+# Store responses depend on the caller's business, so caches must key on the token too
+ETAG_VARY = "If-None-Match, Authorization"
+
+
+def make_etag(*parts) -> str:
+    """Weak ETag derived from the given version markers"""
+    digest = hashlib.blake2b(":".join(str(part) for part in parts).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Vary": ETAG_VARY})
+
+
+# Filterable fields of GET /stores and the columns they match with ILIKE
+STORE_FILTER_COLUMNS = {
+    "store_name": Store.store_name,
+    "store_city": Store.store_city,
+    "store_state": Store.store_state,
+    "store_country": Store.store_country,
+    "store_pincode": Store.store_pincode,
+}
+
+
+def parse_store_filters(filters: str) -> list:
+    """Parse the filters query parameter, a JSON list of {"field": ..., "value": ...} objects"""
+    try:
+        filter_list = json.loads(filters)
+    except json.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid filters. Expected a JSON list of {\"field\", \"value\"} objects."
+        )
+    if not isinstance(filter_list, list) or not all(isinstance(item, dict) for item in filter_list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid filters. Expected a JSON list of {\"field\", \"value\"} objects."
+        )
+    return filter_list
+
 @router.post("/", response_model=StoreResponse, status_code=status.HTTP_201_CREATED)
 async def create_store(
     store_data: StoreCreate,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_role(["owner", "admin"]))
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(require_role_async(["owner", "admin"]))
 ):
     """Create a new store - only owner and admin can create"""
     try:
@@ -30,231 +198,204 @@ async def create_store(
                 detail="Store name is required and cannot be empty."
             )
         
-        logger.info(f"=== CREATE STORE called by user: {current_user.name} (ID: {current_user.emp_id}) ===")
-        logger.info(f"Current user business_id: {current_user.business_id}")
-        logger.info(f"Store data received: {store_data.dict()}")
+        logger.debug("=== CREATE STORE called by user: %s (ID: %s) ===", current_user.name, current_user.emp_id)
         
         # Use current user's business_id
-        user_business_id = str(current_user.business_id)
+        user_business_id = current_user.business_key
         
         # Verify business exists
-        business = db.query(Business).filter(Business.business_id == user_business_id).first()
-        if not business:
-            logger.error(f"Business not found for business_id: {user_business_id}")
+        if not await business_exists(db, user_business_id):
+            logger.error("Business not found for business_id: %s", user_business_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Your business profile was not found. Please contact support."
             )
         
-        logger.info(f"Creating store for business: {business.business_name} (ID: {business.business_id})")
+        logger.debug("Creating store for business ID: %s", user_business_id)
         
-        # Get the next sequence number for this business
-        max_sequence = db.query(Store).filter(
-            Store.business_id == user_business_id
-        ).count()
-        next_sequence = max_sequence + 1
+        # Reserve the next sequence number for this business
+        next_sequence = await next_store_sequence(db, user_business_id)
         
-        logger.info(f"Next store sequence for business {user_business_id}: {next_sequence}")
+        logger.debug("Next store sequence for business %s: %s", user_business_id, next_sequence)
         
         # Create store with user's business_id and sequence
         db_store = Store(
-            **store_data.dict(),
+            **store_data.model_dump(exclude_unset=True),
             business_id=user_business_id,
             store_sequence=next_sequence
         )
         
-        logger.info(f"Store object created - business_id: {user_business_id}, sequence: {next_sequence}")
         db.add(db_store)
-        db.commit()
-        db.refresh(db_store)
+        await db.commit()
+        await db.refresh(db_store)
+        invalidate_store_count(user_business_id)
         
-        logger.info(f"Store created successfully: {db_store.store_name} (ID: {db_store.id}, Store ID: STR{db_store.store_sequence})")
+        logger.info("Store created successfully: %s (ID: %s, Store ID: STR%s)", db_store.store_name, db_store.id, db_store.store_sequence)
         
-        # Return formatted response
-        return {
-            "id": db_store.id,
-            "business_id": db_store.business_id,
-            "store_id": f"STR{db_store.store_sequence}",
-            "store_sequence": db_store.store_sequence,
-            "store_name": db_store.store_name,
-            "store_address": db_store.store_address,
-            "store_city": db_store.store_city,
-            "store_state": db_store.store_state,
-            "store_country": db_store.store_country,
-            "store_pincode": db_store.store_pincode,
-            "created_at": db_store.created_at,
-            "updated_at": db_store.updated_at
-        }
+        return store_response(db_store)
     
-    except HTTPException:
-        raise
     except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Database integrity error while creating store: {str(e)}")
+        await db.rollback()
+        logger.error("Database integrity error while creating store: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A store with this name already exists. Please use a different store name."
         )
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Unexpected error creating store: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while creating the store. Please try again."
-        )
 
-@router.get("/", response_model=dict)
+@router.get("/", response_model=StoreListResponse, response_model_exclude_unset=True)
 async def get_stores(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
     filters: str = None,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(get_current_employee)
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(get_current_employee_async)
 ):
-    """Get all stores with pagination and filtering - all authenticated users can view"""
-    import json
+    """
+    Get all stores with pagination and filtering - all authenticated users can view
     
-    try:
-        logger.info(f"=== GET /stores called by user: {current_user.name} (ID: {current_user.emp_id}) ===")
-        logger.info(f"Filters: {filters}, Skip: {skip}, Limit: {limit}")
-        
-        # Start with base query - filter by business_id
-        query = db.query(Store).filter(Store.business_id == str(current_user.business_id))
-        
-        # Parse multiple filters if provided
-        filter_list = []
-        if filters:
-            try:
-                filter_list = json.loads(filters)
-            except:
-                pass
-        
-        # Apply multiple filters with AND logic
-        if filter_list:
-            for filter_item in filter_list:
-                filter_field_item = filter_item.get('field')
-                filter_value_item = filter_item.get('value')
-                
-                if not filter_field_item or not filter_value_item:
-                    continue
-                
-                # Apply filter based on field
-                if filter_field_item == "store_name":
-                    query = query.filter(Store.store_name.ilike(f"%{filter_value_item}%"))
-                elif filter_field_item == "store_city":
-                    query = query.filter(Store.store_city.ilike(f"%{filter_value_item}%"))
-                elif filter_field_item == "store_state":
-                    query = query.filter(Store.store_state.ilike(f"%{filter_value_item}%"))
-                elif filter_field_item == "store_country":
-                    query = query.filter(Store.store_country.ilike(f"%{filter_value_item}%"))
-                elif filter_field_item == "store_pincode":
-                    query = query.filter(Store.store_pincode.ilike(f"%{filter_value_item}%"))
-        
-        # Get total count after filtering
-        total = query.count()
-        
-        # Apply pagination and ordering
-        stores = query.order_by(Store.store_sequence).offset(skip).limit(limit).all()
-        
-        # Format response with store_id
-        store_responses = []
-        for store in stores:
-            store_dict = {
-                "id": store.id,
-                "business_id": store.business_id,
-                "store_id": f"STR{store.store_sequence}",
-                "store_sequence": store.store_sequence,
-                "store_name": store.store_name,
-                "store_address": store.store_address,
-                "store_city": store.store_city,
-                "store_state": store.store_state,
-                "store_country": store.store_country,
-                "store_pincode": store.store_pincode,
-                "created_at": store.created_at,
-                "updated_at": store.updated_at
-            }
-            store_responses.append(store_dict)
+    Pass the next_cursor from a previous page as cursor to continue after it; skip is
+    deprecated and only used when no cursor is given.
+    total is only counted and returned when include_total is true.
+    Responses carry a weak ETag built from the rows of the page (and total, if requested);
+    a matching If-None-Match gets 304 Not Modified without a response body.
+    """
+    cursor_key = decode_store_cursor(cursor) if cursor else None
+    filter_list = parse_store_filters(filters) if filters else []
+    
+    logger.debug("=== GET /stores called by user: %s (ID: %s) ===", current_user.name, current_user.emp_id)
+    logger.debug("Filters: %s, Skip: %s, Limit: %s, Cursor: %s", filters, skip, limit, cursor)
+    
+    business_id = current_user.business_key
+    
+    # Start with base query - filter by business_id, selecting only response columns
+    query = select(*STORE_RESPONSE_COLUMNS).where(Store.business_id == business_id)
+    
+    # Apply multiple filters with AND logic
+    filtered = False
+    for filter_item in filter_list:
+        column = STORE_FILTER_COLUMNS.get(filter_item.get('field'))
+        filter_value_item = filter_item.get('value')
         
-        logger.info(f"Returning {len(store_responses)} of {total} stores")
+        if column is None or not filter_value_item:
+            continue
         
-        return {
-            "items": store_responses,
-            "total": total,
-            "skip": skip,
-            "limit": limit
-        }
-    except Exception as e:
-        logger.error(f"Error fetching stores: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred while loading stores."
-        )
+        filtered = True
+        query = query.where(column.ilike(f"%{filter_value_item}%"))
+    
+    # Count only on request; the unfiltered per-business count is cached briefly
+    total = None
+    if include_total:
+        if filtered:
+            total = await db.scalar(query.with_only_columns(func.count(Store.id)))
+        else:
+            total = await get_store_count(db, business_id)
+    
+    # Apply pagination and ordering; (store_sequence, id) keeps the order total
+    query = query.order_by(Store.store_sequence, Store.id)
+    if cursor_key:
+        query = query.where(tuple_(Store.store_sequence, Store.id) > cursor_key)
+    else:
+        query = query.offset(skip)
+    
+    # Fetch one extra row to know whether another page follows
+    stores = (await db.execute(query.limit(limit + 1))).all()
+    
+    # The page's version: any change to its rows, to whether a next page exists or
+    # to the returned total changes the ETag (the extra row covers has_more)
+    etag = make_etag(
+        business_id,
+        request.url.query,
+        total,
+        *((store.id, store.updated_at or store.created_at) for store in stores)
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Vary"] = ETAG_VARY
+    
+    has_more = len(stores) > limit
+    stores = stores[:limit]
+    next_cursor = encode_store_cursor(stores[-1]) if has_more else None
+    
+    logger.debug("Returning %d stores (has_more=%s)", len(stores), has_more)
+    
+    # total stays unset (and is left out of the JSON) unless it was requested
+    page = {"total": total} if include_total else {}
+    return StoreListResponse.model_construct(
+        items=[store_response(row) for row in stores],
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+        has_more=has_more,
+        **page
+    )
 
 @router.get("/{store_id}", response_model=StoreResponse)
 async def get_store(
     store_id: int,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(get_current_employee)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(get_current_employee_async)
 ):
-    """Get a specific store by ID"""
-    try:
-        store = db.query(Store).filter(
-            Store.id == store_id,
-            Store.business_id == str(current_user.business_id)
-        ).first()
-        if not store:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Store with ID {store_id} not found."
+    """
+    Get a specific store by ID - returns 304 when If-None-Match matches its ETag
+    
+    The serialized response is cached in-process for STORE_RESPONSE_TTL_SECONDS. A cached
+    body is only served after a timestamp-only query shows the store still exists with the
+    same updated_at, so changes made through another worker are never served stale.
+    """
+    business_id = current_user.business_key
+    cached = store_response_cache.get((business_id, store_id))
+    if cached and cached[0] > time.monotonic():
+        _, cached_version, etag, body = cached
+        current = (await db.execute(
+            select(Store.updated_at, Store.created_at).where(
+                Store.id == store_id,
+                Store.business_id == business_id
             )
-        
-        # Return formatted response
-        return {
-            "id": store.id,
-            "business_id": store.business_id,
-            "store_id": f"STR{store.store_sequence}",
-            "store_sequence": store.store_sequence,
-            "store_name": store.store_name,
-            "store_address": store.store_address,
-            "store_city": store.store_city,
-            "store_state": store.store_state,
-            "store_country": store.store_country,
-            "store_pincode": store.store_pincode,
-            "created_at": store.created_at,
-            "updated_at": store.updated_at
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching store: {str(e)}", exc_info=True)
+        )).one_or_none()
+        if current is not None and (current.updated_at or current.created_at) == cached_version:
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            return Response(content=body, media_type="application/json", headers={"ETag": etag, "Vary": ETAG_VARY})
+        invalidate_store_response(business_id, store_id)
+    
+    store = await db.scalar(
+        select(Store).where(
+            Store.id == store_id,
+            Store.business_id == current_user.business_key
+        )
+    )
+    if not store:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred while loading the store."
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Store with ID {store_id} not found."
         )
+    
+    version = store.updated_at or store.created_at
+    etag = make_etag(store.id, version)
+    body = store_response(store).model_dump_json()
+    cache_store_response(business_id, store_id, version, etag, body)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    return Response(content=body, media_type="application/json", headers={"ETag": etag, "Vary": ETAG_VARY})
 
 @router.put("/{store_id}", response_model=StoreResponse)
 async def update_store(
     store_id: int,
     store_data: StoreUpdate,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_role(["owner", "admin"]))
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(require_role_async(["owner", "admin"]))
 ):
     """Update store details - owner and admin can update"""
     try:
-        store = db.query(Store).filter(
-            Store.id == store_id,
-            Store.business_id == str(current_user.business_id)
-        ).first()
-        if not store:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Store with ID {store_id} not found."
-            )
-        
-        logger.info(f"User {current_user.name} is updating store: {store.store_name}")
-        
         # Update only provided fields
-        update_data = store_data.dict(exclude_unset=True)
+        update_data = store_data.model_dump(exclude_unset=True)
         
         if not update_data:
             raise HTTPException(
@@ -269,89 +410,82 @@ async def update_store(
                 detail="Store name cannot be empty."
             )
         
-        for field, value in update_data.items():
-            setattr(store, field, value)
+        # Apply the update and read back the response columns in one statement
+        result = await db.execute(
+            update(Store)
+            .where(
+                Store.id == store_id,
+                Store.business_id == current_user.business_key
+            )
+            .values(**update_data)
+            .returning(*STORE_RESPONSE_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        store = result.one_or_none()
+        if store is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Store with ID {store_id} not found."
+            )
         
-        db.commit()
-        db.refresh(store)
+        await db.commit()
+        invalidate_store_response(current_user.business_key, store_id)
         
-        logger.info(f"Store updated successfully: {store.store_name}")
+        logger.info("User %s updated store: %s", current_user.name, store.store_name)
         
-        # Return formatted response
-        return {
-            "id": store.id,
-            "business_id": store.business_id,
-            "store_id": f"STR{store.store_sequence}",
-            "store_sequence": store.store_sequence,
-            "store_name": store.store_name,
-            "store_address": store.store_address,
-            "store_city": store.store_city,
-            "store_state": store.store_state,
-            "store_country": store.store_country,
-            "store_pincode": store.store_pincode,
-            "created_at": store.created_at,
-            "updated_at": store.updated_at
-        }
+        return store_response(store)
     
-    except HTTPException:
-        raise
     except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Database integrity error while updating store: {str(e)}")
+        await db.rollback()
+        logger.error("Database integrity error while updating store: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A store with this name already exists. Please use a different store name."
         )
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Unexpected error updating store: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while updating the store."
-        )
 
 @router.delete("/{store_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_store(
     store_id: int,
-    db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_role(["owner", "admin"]))
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Employee = Depends(require_role_async(["owner", "admin"]))
 ):
     """Delete a store - only owner and admin can delete"""
-    try:
-        store = db.query(Store).filter(
-            Store.id == store_id,
-            Store.business_id == str(current_user.business_id)
-        ).first()
-        if not store:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Store with ID {store_id} not found."
-            )
-        
-        logger.info(f"User {current_user.name} is deleting store: {store.store_name}")
-        
-        # First, set store_id to NULL for all employees assigned to this store
-        affected_employees = db.query(Employee).filter(
+    # First, set store_id to NULL for all employees assigned to this store
+    # (matches nothing when the store does not exist in this business)
+    result = await db.execute(
+        update(Employee)
+        .where(
             Employee.store_id == store_id,
             Employee.business_id == current_user.business_id
-        ).update({"store_id": None}, synchronize_session=False)
-        
-        if affected_employees > 0:
-            logger.info(f"Set store_id to NULL for {affected_employees} employees")
-        
-        # Now delete the store
-        db.delete(store)
-        db.commit()
-        
-        logger.info(f"Store deleted successfully: {store.store_name}")
-        return None
+        )
+        .values(store_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    affected_employees = result.rowcount
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Unexpected error deleting store: {str(e)}", exc_info=True)
+    # Now delete the store in one statement, getting back its name for the log
+    store_name = await db.scalar(
+        delete(Store)
+        .where(
+            Store.id == store_id,
+            Store.business_id == current_user.business_key
+        )
+        .returning(Store.store_name)
+        .execution_options(synchronize_session=False)
+    )
+    if store_name is None:
+        await db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while deleting the store."
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Store with ID {store_id} not found."
         )
+    
+    await db.commit()
+    invalidate_store_count(current_user.business_key)
+    invalidate_store_response(current_user.business_key, store_id)
+    
+    if affected_employees > 0:
+        logger.info("Set store_id to NULL for %s employees", affected_employees)
+    logger.info("User %s deleted store: %s", current_user.name, store_name)
+    return None
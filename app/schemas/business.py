@@ -1,46 +1,31 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import ConfigDict, Field
 from typing import Optional
+from app.schemas.common import SchemaModel, EmailAddress, PhoneStr, Str20, Str50, Str100, TrimmedStr100, TrimmedStr200, make_partial
 
-class BusinessBase(BaseModel):
-    business_name: str = Field(..., min_length=1, max_length=200, description="Business name (required)")
-    business_type: Optional[str] = Field(None, max_length=100, description="Business type (optional)")
-    category: Optional[str] = Field(None, max_length=100, description="Business category (optional)")
-    owner_name: str = Field(..., min_length=1, max_length=100, description="Owner name (required)")
-    phone_number: str = Field(..., min_length=1, max_length=20, description="Phone number (required)")
-    email: EmailStr = Field(..., description="Email address (required)")
-    gst_number: Optional[str] = Field(None, max_length=50, description="GST number (optional)")
+class BusinessBase(SchemaModel):
+    business_name: TrimmedStr200 = Field(..., description="Business name (required)")
+    business_type: Optional[Str100] = Field(None, description="Business type (optional)")
+    category: Optional[Str100] = Field(None, description="Business category (optional)")
+    owner_name: TrimmedStr100 = Field(..., description="Owner name (required)")
+    phone_number: PhoneStr = Field(..., description="Phone number (required)")
+    email: EmailAddress = Field(..., description="Email address (required)")
+    gst_number: Optional[Str50] = Field(None, description="GST number (optional)")
     address: Optional[str] = Field(None, description="Business address (optional)")
-    city: Optional[str] = Field(None, max_length=100, description="City (optional)")
-    state: Optional[str] = Field(None, max_length=100, description="State (optional)")
-    pincode: Optional[str] = Field(None, max_length=20, description="Pincode (optional)")
-    country: Optional[str] = Field(None, max_length=100, description="Country (optional)")
-    invoice_prefix: Optional[str] = Field(None, max_length=20, description="Invoice prefix (optional)")
-    bank_account_number: Optional[str] = Field(None, max_length=50, description="Bank account number (optional)")
-    ifsc_code: Optional[str] = Field(None, max_length=20, description="IFSC code (optional)")
-    upi_id: Optional[str] = Field(None, max_length=100, description="UPI ID (optional)")
+    city: Optional[Str100] = Field(None, description="City (optional)")
+    state: Optional[Str100] = Field(None, description="State (optional)")
+    pincode: Optional[Str20] = Field(None, description="Pincode (optional)")
+    country: Optional[Str100] = Field(None, description="Country (optional)")
+    invoice_prefix: Optional[Str20] = Field(None, description="Invoice prefix (optional)")
+    bank_account_number: Optional[Str50] = Field(None, description="Bank account number (optional)")
+    ifsc_code: Optional[Str20] = Field(None, description="IFSC code (optional)")
+    upi_id: Optional[Str100] = Field(None, description="UPI ID (optional)")
 
 class BusinessCreate(BusinessBase):
     pass
 
-class BusinessUpdate(BaseModel):
-    business_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    business_type: Optional[str] = Field(None, max_length=100)
-    category: Optional[str] = Field(None, max_length=100)
-    owner_name: Optional[str] = Field(None, min_length=1, max_length=100)
-    phone_number: Optional[str] = Field(None, min_length=1, max_length=20)
-    email: Optional[EmailStr] = None
-    gst_number: Optional[str] = Field(None, max_length=50)
-    address: Optional[str] = None
-    city: Optional[str] = Field(None, max_length=100)
-    state: Optional[str] = Field(None, max_length=100)
-    pincode: Optional[str] = Field(None, max_length=20)
-    country: Optional[str] = Field(None, max_length=100)
-    invoice_prefix: Optional[str] = Field(None, max_length=20)
-    bank_account_number: Optional[str] = Field(None, max_length=50)
-    ifsc_code: Optional[str] = Field(None, max_length=20)
-    upi_id: Optional[str] = Field(None, max_length=100)
+BusinessUpdate = make_partial(BusinessBase, "BusinessUpdate")
 
-class BusinessResponse(BaseModel):
+class BusinessResponse(SchemaModel):
     business_id: str  # Primary key - unique business ID
     business_name: str
     business_type: Optional[str] = None
@@ -60,5 +45,4 @@ class BusinessResponse(BaseModel):
     upi_id: Optional[str] = None
     has_logo: Optional[bool] = False  # Indicate if logo exists
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -1,12 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
 from typing import Optional
 from datetime import datetime
+from app.schemas.common import SchemaModel, Str500, TrimmedStr100, make_partial
 
 
-class CategoryBase(BaseModel):
+class CategoryBase(SchemaModel):
     """Base schema for category data"""
-    name: str = Field(..., min_length=1, max_length=100, description="Category name")
-    description: Optional[str] = Field(None, max_length=500, description="Category description")
+    name: TrimmedStr100 = Field(..., description="Category name")
+    description: Optional[Str500] = Field(None, description="Category description")
 
 
 class CategoryCreate(CategoryBase):
@@ -14,10 +15,7 @@ class CategoryCreate(CategoryBase):
     pass
 
 
-class CategoryUpdate(BaseModel):
-    """Schema for updating an existing category"""
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    description: Optional[str] = Field(None, max_length=500)
+CategoryUpdate = make_partial(CategoryBase, "CategoryUpdate", doc="Schema for updating an existing category")
 
 
 class CategoryResponse(CategoryBase):
@@ -26,5 +24,4 @@ class CategoryResponse(CategoryBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -0,0 +1,64 @@
+from typing import Annotated, Any, Literal, Optional
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints, create_model
+
+
+class SchemaModel(BaseModel):
+    """
+    Base for every request/response schema in the app
+
+    Core schemas are built on first use rather than at import, so models a
+    process never touches cost nothing; subclasses' model_config merges on top.
+    """
+    model_config = ConfigDict(defer_build=True, extra="ignore", populate_by_name=True)
+
+
+def make_partial(model: type[BaseModel], name: str, doc: Optional[str] = None, **extra_fields: Any) -> type[BaseModel]:
+    """
+    Build the all-optional update variant of a create schema
+
+    Every field keeps its type, constraints and description but defaults to None, so
+    model_dump(exclude_unset=True) returns only what the client sent. The variant
+    subclasses model to inherit its validators and config; extra_fields are added as-is.
+    """
+    fields = {
+        field_name: (
+            Optional[Annotated[(field.annotation, *field.metadata)]] if field.metadata else Optional[field.annotation],
+            Field(None, description=field.description, examples=field.examples),
+        )
+        for field_name, field in model.model_fields.items()
+    }
+    return create_model(name, __base__=model, __module__=model.__module__, __doc__=doc, **fields, **extra_fields)
+
+
+# Required text: surrounding whitespace is trimmed and the result must not be empty.
+# Suffix is the max length of the column the value is stored in.
+TrimmedStr50 = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=50)]
+TrimmedStr100 = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)]
+TrimmedStr200 = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)]
+TrimmedStr500 = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=500)]
+
+# Free text capped at the column length, for optional fields that may be blank
+Str20 = Annotated[str, StringConstraints(max_length=20)]
+Str50 = Annotated[str, StringConstraints(max_length=50)]
+Str100 = Annotated[str, StringConstraints(max_length=100)]
+Str500 = Annotated[str, StringConstraints(max_length=500)]
+
+PhoneStr = Annotated[str, StringConstraints(min_length=1, max_length=20)]
+
+
+def lower_email_domain(value: str) -> str:
+    """Lowercase the domain part only, matching how addresses were normalised when stored"""
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# The format check is a regex run inside pydantic-core rather than a full email-validator parse
+EmailAddress = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=254, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$"),
+    AfterValidator(lower_email_domain),
+]
+
+# Roles an employee can be created with or moved to
+Role = Literal["owner", "admin", "manager", "cashier", "employee"]
@@ -1,20 +1,21 @@
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
 from typing import List, Optional, Literal
 from datetime import datetime
+from app.schemas.common import SchemaModel
 
-class CustomLabelCreate(BaseModel):
+class CustomLabelCreate(SchemaModel):
     """Schema for creating a custom label"""
     label_name: str = Field(..., min_length=1, max_length=100, description="Name of the custom label")
-    label_values: List[str] = Field(..., min_items=1, description="Array of predefined values for this label")
+    label_values: List[str] = Field(..., min_length=1, description="Array of predefined values for this label")
     label_type: Literal["employee", "product"] = Field(default="employee", description="Type of label: 'employee' or 'product'")
 
-class CustomLabelUpdate(BaseModel):
+class CustomLabelUpdate(SchemaModel):
     """Schema for updating a custom label"""
     label_name: Optional[str] = Field(None, min_length=1, max_length=100, description="Updated name of the custom label")
-    label_values: List[str] = Field(..., min_items=1, description="Array of predefined values for this label")
+    label_values: List[str] = Field(..., min_length=1, description="Array of predefined values for this label")
     label_type: Optional[Literal["employee", "product"]] = Field(None, description="Type of label: 'employee' or 'product'")
 
-class CustomLabel(BaseModel):
+class CustomLabel(SchemaModel):
     """Schema for custom label response"""
     id: int
     label_name: str
@@ -24,5 +25,4 @@ class CustomLabel(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
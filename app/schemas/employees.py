@@ -1,31 +1,115 @@
-from pydantic import BaseModel, Field, EmailStr, field_validator, model_validator
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from pydantic import AliasChoices, BeforeValidator, ConfigDict, Field, PlainSerializer, computed_field
+from typing import Annotated, Optional, List, Dict, Any, Union
+from datetime import date, datetime
+from app.schemas.common import SchemaModel, EmailAddress, PhoneStr, Role, Str100, TrimmedStr100, make_partial
+
+JOINING_DATE_FORMAT = "%d/%m/%Y"
+
+
+def parse_joining_date(value):
+    """Accept dd/mm/yyyy strings; anything else is left to pydantic's own date parsing"""
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        if "/" in value:
+            try:
+                return datetime.strptime(value, JOINING_DATE_FORMAT).date()
+            except ValueError:
+                raise ValueError("Joining date must be a valid date in dd/mm/yyyy format")
+    return value
+
+
+def read_joining_date(value) -> Union[date, str, None]:
+    """
+    Lenient parse for joining dates read back from the database
+    
+    Rows written before the column was validated may hold ISO or other free-text
+    dates: dd/mm/yyyy and ISO are understood, anything else is returned as the
+    stored string so it is neither hidden nor overwritten by a round trip.
+    """
+    if isinstance(value, date):
+        return value
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, JOINING_DATE_FORMAT).date()
+    except ValueError:
+        pass
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def format_joining_date(value) -> Optional[str]:
+    """dd/mm/yyyy wire and storage format for joining dates; strings are passed through as-is"""
+    if value is None or isinstance(value, str):
+        return value
+    return value.strftime(JOINING_DATE_FORMAT)
+
+
+# Request input: must be dd/mm/yyyy (or ISO) when given
+JoiningDate = Annotated[
+    Optional[date],
+    BeforeValidator(parse_joining_date),
+    PlainSerializer(format_joining_date, return_type=Optional[str]),
+]
+
+# Responses: stored values are read leniently so legacy rows never fail validation;
+# unparseable ones are kept as the raw string
+StoredJoiningDate = Annotated[
+    Union[date, str, None],
+    BeforeValidator(read_joining_date),
+    PlainSerializer(format_joining_date, return_type=Optional[str]),
+]
+
+
+def flatten_custom_fields(value):
+    """Fold legacy [{label: value}, ...] lists and EmployeeLabel rows into one {label: value} dict"""
+    if value is None:
+        return {}
+    if isinstance(value, list):
+        flat = {}
+        for item in value:
+            if isinstance(item, dict):
+                flat.update(item)
+            else:
+                flat[item.label_name] = item.label_value
+        return flat
+    return value
+
+
+CustomFields = Annotated[Dict[str, str], BeforeValidator(flatten_custom_fields)]
 
-class EmployeeLogin(BaseModel):
+class EmployeeLogin(SchemaModel):
     user_id: str = Field(..., description="Employee user ID (format: USR1000)")
     password: str = Field(..., description="Employee password")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "USR1000",
                 "password": "myPassword123"
             }
         }
+    )
 
-class EmployeeBase(BaseModel):
-    name: str = Field(..., min_length=1, max_length=100, description="Employee name (required, max 100 characters)")
-    email: EmailStr = Field(..., description="Employee email address (required)")
-    phone_number: str = Field(..., min_length=1, max_length=20, description="Phone number (required, max 20 characters)")
+class EmployeeBase(SchemaModel):
+    name: TrimmedStr100 = Field(..., description="Employee name (required, max 100 characters)")
+    email: EmailAddress = Field(..., description="Employee email address (required)")
+    phone_number: PhoneStr = Field(..., description="Phone number (required, max 20 characters)")
     aadhar_number: Optional[str] = Field(None, max_length=12, description="Aadhar number (optional, max 12 characters)")
     address: Optional[str] = Field(None, max_length=255, description="Address (optional)")
-    city: Optional[str] = Field(None, max_length=100, description="City (optional)")
-    state: Optional[str] = Field(None, max_length=100, description="State (optional)")
-    country: Optional[str] = Field(None, max_length=100, description="Country (optional)")
-    role: str = Field(..., description="Role of the employee (required)")
-    joining_date: Optional[str] = Field(None, description="Joining date in dd/mm/yyyy format (optional)")
-    custom_fields: Optional[List[Dict[str, str]]] = Field(None, description="Custom fields as array of {labelname: labelvalue}")
+    city: Optional[Str100] = Field(None, description="City (optional)")
+    state: Optional[Str100] = Field(None, description="State (optional)")
+    country: Optional[Str100] = Field(None, description="Country (optional)")
+    role: Role = Field(..., description="Role of the employee (required)")
+    joining_date: JoiningDate = Field(None, description="Joining date in dd/mm/yyyy format (optional)")
+    custom_fields: CustomFields = Field(default_factory=dict, description="Custom fields as {labelname: labelvalue}")
     store_id: Optional[int] = Field(None, description="Store ID (optional for owner, required for other roles)")
 
 class EmployeeCreate(EmployeeBase):
@@ -34,8 +118,8 @@ class EmployeeCreate(EmployeeBase):
         description="Password (minimum 8 characters)",
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "John Doe",
                 "email": "john@example.com",
@@ -47,32 +131,25 @@ class EmployeeCreate(EmployeeBase):
                 "country": "India",
                 "role": "employee",
                 "joining_date": "01/01/2025",
-                "custom_fields": [{"Emergency Contact": "9876543210"}, {"Blood Group": "O+"}],
+                "custom_fields": {"Emergency Contact": "9876543210", "Blood Group": "O+"},
                 "password": "myPassword123",
                 "store_id": 1
             }
         }
+    )
 
-class EmployeeUpdate(BaseModel):
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    email: Optional[EmailStr] = None
-    phone_number: Optional[str] = Field(None, min_length=1, max_length=20)
-    aadhar_number: Optional[str] = Field(None, max_length=12)
-    address: Optional[str] = Field(None, max_length=255)
-    city: Optional[str] = Field(None, max_length=100)
-    state: Optional[str] = Field(None, max_length=100)
-    country: Optional[str] = Field(None, max_length=100)
-    role: Optional[str] = None
-    joining_date: Optional[str] = None
-    custom_fields: Optional[List[Dict[str, str]]] = None
-    password: Optional[str] = Field(None, min_length=8)
-    store_id: Optional[int] = None
+EmployeeUpdate = make_partial(
+    EmployeeBase,
+    "EmployeeUpdate",
+    password=(Optional[str], Field(None, min_length=8)),
+)
 
 class Employee(EmployeeBase):
+    # Stored rows are not limited to the Role literal, so responses accept any role
+    role: str
+    joining_date: StoredJoiningDate = Field(None, description="Joining date in dd/mm/yyyy format")
     emp_id: int
     business_id: Optional[int] = None
-    business_id_display: str = Field(default="", description="Formatted business ID (BUS20000, etc.)")
-    user_id: Optional[str] = None
     store_id: Optional[int] = None
     store_id_display: Optional[str] = Field(None, description="Formatted store ID (STR1, STR2, etc.)")
     store_name: Optional[str] = Field(None, description="Store name")
@@ -80,110 +157,77 @@ class Employee(EmployeeBase):
     updated_by: Optional[int] = None
     avatar_url: Optional[str] = None
     thumbnail_url: Optional[str] = None
+    # ORM rows carry their custom fields on the labels relationship
+    custom_fields: CustomFields = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("labels", "custom_fields"),
+        description="Custom fields as {labelname: labelvalue}"
+    )
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
     
-    @classmethod
-    def from_orm(cls, obj):
-        data = super().from_orm(obj)
-        data.business_id_display = f"BUS{obj.business_id}"
-        return data
+    @computed_field
+    @property
+    def user_id(self) -> str:
+        return f"USR{self.emp_id}"
     
-    @model_validator(mode='before')
-    @classmethod
-    def extract_from_orm(cls, data):
-        """Extract and transform data from ORM object"""
-        
-        # If data is an ORM object (has __dict__), extract attributes
-        if hasattr(data, '__dict__'):
-            obj = data
-            result = {}
-            
-            # Copy all basic fields
-            for field_name in ['emp_id', 'business_id', 'store_id', 'created_by', 'updated_by',
-                              'name', 'email', 'phone_number', 'aadhar_number', 'address',
-                              'city', 'state', 'country', 'role', 'joining_date', 
-                              'avatar_url', 'thumbnail_url']:
-                if hasattr(obj, field_name):
-                    result[field_name] = getattr(obj, field_name)
-            
-            # Generate user_id
-            if hasattr(obj, 'emp_id'):
-                result['user_id'] = f"USR{obj.emp_id}"
-            
-            # Load custom_fields from labels relationship or direct field
-            if hasattr(obj, 'labels') and obj.labels:
-                result['custom_fields'] = [
-                    {label.label_name: label.label_value} 
-                    for label in obj.labels
-                ]
-            elif hasattr(obj, 'custom_fields'):
-                result['custom_fields'] = obj.custom_fields
-            else:
-                result['custom_fields'] = []
-            
-            return result
-        
-        # If already a dict, return as is
-        return data
-
-class TokenWithRefresh(BaseModel):
+    @computed_field(description="Formatted business ID (BUS20000, etc.)")
+    @property
+    def business_id_display(self) -> str:
+        return f"BUS{self.business_id}" if self.business_id is not None else ""
+
+class TokenWithRefresh(SchemaModel):
     access_token: str
     token_type: str
     refresh_token: str
+    
+    model_config = ConfigDict(frozen=True)
 
-class RefreshTokenRequest(BaseModel):
+class RefreshTokenRequest(SchemaModel):
     refresh_token: str
 
-class EmployeePaginatedResponse(BaseModel):
+class EmployeePaginatedResponse(SchemaModel):
     items: List[Employee]
     total: int
     page: int
     page_size: int
 
-class OwnerRegistration(BaseModel):
-    name: str = Field(..., min_length=1, max_length=100, description="Owner name (required)")
-    email: EmailStr = Field(..., description="Owner email address (required)")
-    phone_number: str = Field(..., min_length=1, max_length=20, description="Phone number (required)")
+class OwnerRegistration(SchemaModel):
+    name: TrimmedStr100 = Field(..., description="Owner name (required)")
+    email: EmailAddress = Field(..., description="Owner email address (required)")
+    phone_number: PhoneStr = Field(..., description="Phone number (required)")
     password: str = Field(..., min_length=8, description="Password (minimum 8 characters)")
-    confirm_password: str = Field(..., min_length=8, description="Confirm password (minimum 8 characters)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "John Owner",
                 "email": "owner@example.com",
                 "phone_number": "1234567890",
-                "password": "securePassword123",
-                "confirm_password": "securePassword123"
+                "password": "securePassword123"
             }
         }
+    )
 
-class ForgotPasswordRequest(BaseModel):
+class ForgotPasswordRequest(SchemaModel):
     user_id: str = Field(..., description="User ID (format: USR1000)")
-    email: EmailStr = Field(..., description="Registered email address")
+    email: EmailAddress = Field(..., description="Registered email address")
 
-class ResetPasswordRequest(BaseModel):
+class ResetPasswordRequest(SchemaModel):
     token: str = Field(..., description="Password reset token")
     user_id: str = Field(..., description="User ID")
     new_password: str = Field(..., min_length=8, description="New password (minimum 8 characters)")
-    confirm_password: str = Field(..., min_length=8, description="Confirm new password")
 
-class ForgotUsernameRequest(BaseModel):
-    email: EmailStr = Field(..., description="Registered email address")
+class ForgotUsernameRequest(SchemaModel):
+    email: EmailAddress = Field(..., description="Registered email address")
     business_id: Optional[int] = Field(None, description="Business ID (optional - filter results to specific business)")
 
-class VerifyOTPRequest(BaseModel):
-    email: EmailStr = Field(..., description="Email address")
+class VerifyOTPRequest(SchemaModel):
+    email: EmailAddress = Field(..., description="Email address")
     otp: str = Field(..., min_length=6, max_length=6, description="6-digit OTP")
 
-class ForgotPasswordOTPRequest(BaseModel):
-    user_id: str = Field(..., description="User ID (format: USR1000)")
-    email: EmailStr = Field(..., description="Registered email address")
-
 
-class ChangePasswordRequest(BaseModel):
+class ChangePasswordRequest(SchemaModel):
     current_password: str = Field(..., description="Current password")
     new_password: str = Field(..., min_length=6, description="New password (min 6 characters)")
 
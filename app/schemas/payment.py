@@ -1,27 +1,34 @@
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
 from typing import Optional
+from app.schemas.common import SchemaModel
 
-class PaymentOrderRequest(BaseModel):
+class PaymentOrderRequest(SchemaModel):
     user_id: str = Field(..., description="User ID (format: USR1000)")
     amount: int = Field(..., description="Amount in paise (500 rupees = 50000 paise)")
 
-class PaymentStatusResponse(BaseModel):
+class PaymentStatusResponse(SchemaModel):
     payment_completed: bool
     is_owner: bool
     message: Optional[str] = None
+    
+    model_config = ConfigDict(frozen=True)
 
-class PaymentOrderResponse(BaseModel):
+class PaymentOrderResponse(SchemaModel):
     order_id: str
     amount: int
     currency: str
     user_id: str
+    
+    model_config = ConfigDict(frozen=True)
 
-class PaymentVerifyRequest(BaseModel):
+class PaymentVerifyRequest(SchemaModel):
     razorpay_order_id: str = Field(..., description="Razorpay order ID")
     razorpay_payment_id: str = Field(..., description="Razorpay payment ID")
     razorpay_signature: str = Field(..., description="Razorpay signature for verification")
 
-class PaymentVerifyResponse(BaseModel):
+class PaymentVerifyResponse(SchemaModel):
     success: bool
     message: str
     payment_id: Optional[str] = None
+    
+    model_config = ConfigDict(frozen=True)
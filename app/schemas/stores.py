@@ -1,39 +1,39 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import ConfigDict, Field, computed_field
+from typing import List, Optional
 from datetime import datetime
+from app.schemas.common import SchemaModel, Str20, Str100, Str500, TrimmedStr200, make_partial
 
-class StoreBase(BaseModel):
-    store_name: str = Field(..., min_length=1, max_length=200, description="Store name (required)")
-    store_address: Optional[str] = Field(None, max_length=500, description="Store address")
-    store_city: Optional[str] = Field(None, max_length=100, description="Store city")
-    store_state: Optional[str] = Field(None, max_length=100, description="Store state")
-    store_country: Optional[str] = Field(None, max_length=100, description="Store country")
-    store_pincode: Optional[str] = Field(None, max_length=20, description="Store pincode")
+class StoreBase(SchemaModel):
+    store_name: TrimmedStr200 = Field(..., description="Store name (required)")
+    store_address: Optional[Str500] = Field(None, description="Store address")
+    store_city: Optional[Str100] = Field(None, description="Store city")
+    store_state: Optional[Str100] = Field(None, description="Store state")
+    store_country: Optional[Str100] = Field(None, description="Store country")
+    store_pincode: Optional[Str20] = Field(None, description="Store pincode")
 
 class StoreCreate(StoreBase):
     pass
 
-class StoreUpdate(BaseModel):
-    store_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    store_address: Optional[str] = Field(None, max_length=500)
-    store_city: Optional[str] = Field(None, max_length=100)
-    store_state: Optional[str] = Field(None, max_length=100)
-    store_country: Optional[str] = Field(None, max_length=100)
-    store_pincode: Optional[str] = Field(None, max_length=20)
+StoreUpdate = make_partial(StoreBase, "StoreUpdate")
 
 class StoreResponse(StoreBase):
     id: int
     business_id: str
-    store_id: str = Field(default="", description="Formatted store ID (STR1, STR2, etc.)")
     store_sequence: int
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
     
-    @classmethod
-    def from_orm(cls, obj):
-        data = super().from_orm(obj)
-        data.store_id = f"STR{obj.store_sequence}"
-        return data
+    @computed_field(description="Formatted store ID (STR1, STR2, etc.)")
+    @property
+    def store_id(self) -> str:
+        return f"STR{self.store_sequence}"
+
+class StoreListResponse(SchemaModel):
+    items: List[StoreResponse]
+    skip: int
+    limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool
+    total: Optional[int] = None
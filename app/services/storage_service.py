@@ -1,13 +1,27 @@
-from google.cloud import storage
-from google.oauth2 import service_account
-from PIL import Image
+import asyncio
+import binascii
 import io
+import logging
 import os
-from datetime import datetime
-import uuid
-from typing import Optional, Tuple
+import secrets
+import time
+from typing import TYPE_CHECKING, BinaryIO, Optional, Tuple
 from fastapi import UploadFile
 
+# google-cloud-storage and Pillow are imported where they are first needed, so
+# processes without GCS configured or that never touch an image skip their import cost
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Image extensions kept from the uploaded filename; anything else is stored as .jpg
+ALLOWED_IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "webp", "gif"})
+
+# Uploaded objects are made public in the upload request itself rather than with a
+# separate make_public() call, saving one GCS round trip per object
+PUBLIC_READ_ACL = "publicRead"
+
 class StorageService:
     def __init__(self):
         credentials_path = os.getenv("GCS_CREDENTIALS_PATH")
@@ -24,24 +38,30 @@ class StorageService:
         if not os.path.exists(credentials_path):
             raise ValueError(f"GCS credentials file not found at: {credentials_path}")
         
+        from google.cloud import storage
+        from google.oauth2 import service_account
+        
         credentials = service_account.Credentials.from_service_account_file(
             credentials_path
         )
         self.client = storage.Client(credentials=credentials)
         self.bucket = self.client.bucket(self.bucket_name)
     
+    def _unique_name(self) -> str:
+        """Unix seconds plus 32 random bits, e.g. 1760000000_9f86d081"""
+        return f"{time.time_ns() // 1_000_000_000}_{secrets.token_hex(4)}"
+    
     def _generate_filename(self, original_filename: str, prefix: str) -> str:
         """Generate unique filename"""
-        ext = os.path.splitext(original_filename)[1].lower()
-        if not ext:
-            ext = '.jpg'
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
-        return f"{prefix}/{timestamp}_{unique_id}{ext}"
+        tail = original_filename.rpartition('.')[2].lower()
+        ext = f".{tail}" if tail in ALLOWED_IMAGE_EXTENSIONS else ".jpg"
+        return f"{prefix}/{self._unique_name()}{ext}"
     
-    def _optimize_image(self, file_content: bytes, max_size: Tuple[int, int] = (1920, 1920)) -> bytes:
-        """Optimize and compress image"""
-        image = Image.open(io.BytesIO(file_content))
+    def _decode_and_normalize(self, fp: BinaryIO) -> "Image.Image":
+        """Decode an image from a binary file object and flatten it to RGB (transparency becomes white)"""
+        from PIL import Image
+        
+        image = Image.open(fp)
         
         # Convert RGBA to RGB if needed
         if image.mode == 'RGBA':
@@ -50,31 +70,23 @@ class StorageService:
             image = background
         elif image.mode != 'RGB':
             image = image.convert('RGB')
+        return image
+    
+    def _shrink_and_encode(self, image: "Image.Image", max_size: Tuple[int, int], quality: int) -> bytes:
+        """Shrink image in place to fit max_size (never enlarging it) and encode it as JPEG"""
+        from PIL import Image
         
-        # Resize if larger than max_size
         image.thumbnail(max_size, Image.Resampling.LANCZOS)
         
-        # Save optimized image
+        # No optimize=True: the extra Huffman-table pass costs more CPU than the few
+        # percent of bytes it saves on CDN-served images
         output = io.BytesIO()
-        image.save(output, format='JPEG', quality=85, optimize=True)
+        image.save(output, format='JPEG', quality=quality)
         return output.getvalue()
     
-    def _create_thumbnail(self, file_content: bytes, size: Tuple[int, int] = (300, 300)) -> bytes:
-        """Create thumbnail"""
-        image = Image.open(io.BytesIO(file_content))
-        
-        if image.mode == 'RGBA':
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[3])
-            image = background
-        elif image.mode != 'RGB':
-            image = image.convert('RGB')
-        
-        image.thumbnail(size, Image.Resampling.LANCZOS)
-        
-        output = io.BytesIO()
-        image.save(output, format='JPEG', quality=80, optimize=True)
-        return output.getvalue()
+    def _optimize_image(self, file_content: bytes, max_size: Tuple[int, int] = (1920, 1920)) -> bytes:
+        """Optimize and compress image"""
+        return self._shrink_and_encode(self._decode_and_normalize(io.BytesIO(file_content)), max_size, quality=85)
     
     async def upload_image(
         self, 
@@ -94,11 +106,14 @@ class StorageService:
             dict with 'url' and optionally 'thumbnail_url'
         """
         try:
-            # Read file content
-            content = await file.read()
+            # Decode straight from the spooled upload file instead of reading it into
+            # memory first; the main image is shrunk in place and the thumbnail, if
+            # requested, is then taken from it rather than from the original
+            await file.seek(0)
+            image = self._decode_and_normalize(file.file)
             
             # Optimize main image
-            optimized_content = self._optimize_image(content)
+            optimized_content = self._shrink_and_encode(image, (1920, 1920), quality=85)
             
             # Generate filename
             filename = self._generate_filename(file.filename, folder)
@@ -107,9 +122,9 @@ class StorageService:
             blob = self.bucket.blob(filename)
             blob.upload_from_string(
                 optimized_content,
-                content_type='image/jpeg'
+                content_type='image/jpeg',
+                predefined_acl=PUBLIC_READ_ACL
             )
-            blob.make_public()
             
             result = {
                 "url": f"{self.cdn_base_url}/{filename}"
@@ -117,16 +132,16 @@ class StorageService:
             
             # Create and upload thumbnail if requested
             if create_thumbnail:
-                thumbnail_content = self._create_thumbnail(content)
+                thumbnail_content = self._shrink_and_encode(image, (300, 300), quality=80)
                 # Create thumbs folder within the main folder
                 thumbnail_filename = filename.replace(f"{folder}/", f"{folder}/thumbs/")
                 
                 thumb_blob = self.bucket.blob(thumbnail_filename)
                 thumb_blob.upload_from_string(
                     thumbnail_content,
-                    content_type='image/jpeg'
+                    content_type='image/jpeg',
+                    predefined_acl=PUBLIC_READ_ACL
                 )
-                thumb_blob.make_public()
                 
                 result["thumbnail_url"] = f"{self.cdn_base_url}/{thumbnail_filename}"
             
@@ -157,7 +172,7 @@ class StorageService:
             
             return True
         except Exception as e:
-            print(f"Failed to delete image: {str(e)}")
+            logger.error("Failed to delete image: %s", e)
             return False
     
     def upload_base64_image(self, base64_data: str, folder: str = "products") -> str:
@@ -171,73 +186,84 @@ class StorageService:
         Returns:
             Public URL of uploaded image
         """
-        import base64
-        import logging
-        
         try:
             # Remove data URI prefix if present (e.g., "data:image/jpeg;base64,")
-            if "," in base64_data and base64_data.startswith("data:"):
-                base64_data = base64_data.split(",")[1]
+            if base64_data.startswith("data:"):
+                base64_data = base64_data.split(",", 1)[-1]
             
-            logging.info(f"Decoding base64 image (length: {len(base64_data)} chars)")
+            logger.debug("Decoding base64 image (length: %d chars)", len(base64_data))
             
             # Decode base64 to bytes
-            image_bytes = base64.b64decode(base64_data)
-            logging.info(f"Decoded image size: {len(image_bytes)} bytes")
+            image_bytes = binascii.a2b_base64(base64_data)
+            logger.debug("Decoded image size: %d bytes", len(image_bytes))
             
             # Optimize image
             optimized_content = self._optimize_image(image_bytes)
-            logging.info(f"Optimized image size: {len(optimized_content)} bytes")
+            logger.debug("Optimized image size: %d bytes", len(optimized_content))
             
             # Generate unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            unique_id = str(uuid.uuid4())[:8]
-            filename = f"{folder}/{timestamp}_{unique_id}.jpg"
+            filename = f"{folder}/{self._unique_name()}.jpg"
             
-            logging.info(f"Uploading image to GCS: {filename}")
+            logger.debug("Uploading image to GCS: %s", filename)
             
             # Upload to GCS
             blob = self.bucket.blob(filename)
-            blob.upload_from_string(optimized_content, content_type="image/jpeg")
-            blob.make_public()
+            blob.upload_from_string(optimized_content, content_type="image/jpeg", predefined_acl=PUBLIC_READ_ACL)
             
             url = f"{self.cdn_base_url}/{filename}"
-            logging.info(f"Image uploaded successfully: {url}")
+            logger.info("Image uploaded successfully: %s", url)
             
             return url
             
         except Exception as e:
             raise Exception(f"Failed to upload base64 image: {str(e)}")
     
-    def upload_product_images(self, base64_images: list, max_images: int = 5) -> list:
+    async def upload_product_images_async(
+        self,
+        base64_images: list,
+        max_images: int = 5,
+        max_concurrency: int = 8
+    ) -> list:
         """
-        Upload multiple product images from base64
+        Upload multiple product images from base64 concurrently
+        
+        The images are uploaded in parallel (the GCS client is blocking, so each
+        upload runs in a worker thread); failed images are logged and skipped, and an
+        exception is raised only if every image failed
         
         Args:
             base64_images: List of base64 encoded images
             max_images: Maximum number of images allowed (default: 5)
+            max_concurrency: Maximum number of uploads in flight at once
             
         Returns:
-            List of public URLs
+            List of public URLs, in the same order as the input
             
         Raises:
             ValueError: If more than max_images are provided
         """
-        import logging
-        
         if len(base64_images) > max_images:
             raise ValueError(f"Maximum {max_images} images allowed. You provided {len(base64_images)} images.")
         
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def upload_one(base64_img: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(self.upload_base64_image, base64_img, "products")
+        
+        results = await asyncio.gather(
+            *(upload_one(base64_img) for base64_img in base64_images),
+            return_exceptions=True
+        )
+        
         uploaded_urls = []
         failed_count = 0
-        
-        for base64_img in base64_images:
-            try:
-                url = self.upload_base64_image(base64_img, folder="products")
-                uploaded_urls.append(url)
-            except Exception as e:
+        for result in results:
+            if isinstance(result, Exception):
                 failed_count += 1
-                logging.error(f"Failed to upload image: {str(e)}")
+                logger.error("Failed to upload image: %s", result)
+            else:
+                uploaded_urls.append(result)
         
         # If all images failed, raise an exception
         if failed_count > 0 and len(uploaded_urls) == 0:
@@ -249,7 +275,6 @@ class StorageService:
 try:
     storage_service = StorageService()
 except Exception as e:
-    import logging
-    logging.error(f"Failed to initialize StorageService: {str(e)}")
-    logging.error("Make sure GCS_CREDENTIALS_PATH, GCS_BUCKET_NAME, and CDN_BASE_URL are set in .env file")
+    logger.error("Failed to initialize StorageService: %s", e)
+    logger.error("Make sure GCS_CREDENTIALS_PATH, GCS_BUCKET_NAME, and CDN_BASE_URL are set in .env file")
     storage_service = None
@@ -33,9 +33,9 @@ def send_email(to_email: str, subject: str, html_content: str, text_content: Opt
         True if email sent successfully, False otherwise
     """
     if not SMTP_USER or not SMTP_PASSWORD:
-        logger.warning(f"SMTP credentials not configured. Email to {to_email} not sent. Please configure SMTP_USER and SMTP_PASSWORD environment variables.")
-        logger.info(f"Email would have been sent to: {to_email}")
-        logger.info(f"Subject: {subject}")
+        logger.warning("SMTP credentials not configured. Email to %s not sent. Please configure SMTP_USER and SMTP_PASSWORD environment variables.", to_email)
+        logger.info("Email would have been sent to: %s", to_email)
+        logger.info("Subject: %s", subject)
         return False
     
     try:
@@ -61,11 +61,11 @@ def send_email(to_email: str, subject: str, html_content: str, text_content: Opt
             server.login(SMTP_USER, SMTP_PASSWORD)
             server.send_message(message)
         
-        logger.info(f"Email sent successfully to {to_email}")
+        logger.info("Email sent successfully to %s", to_email)
         return True
     
     except Exception as e:
-        logger.error(f"Failed to send email to {to_email}: {str(e)}")
+        logger.error("Failed to send email to %s: %s", to_email, e)
         return False
 
 
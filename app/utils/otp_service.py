@@ -41,7 +41,7 @@ def store_otp(email: str, user_id: str, purpose: str) -> str:
         "purpose": purpose
     }
     
-    logger.info(f"OTP stored for {email}, purpose: {purpose}, expires at: {expires_at}")
+    logger.info("OTP stored for %s, purpose: %s, expires at: %s", email, purpose, expires_at)
     return otp
 
 
@@ -58,30 +58,30 @@ def verify_otp(email: str, otp: str, purpose: str) -> Optional[str]:
         User ID if OTP is valid, None otherwise
     """
     if email not in otp_storage:
-        logger.warning(f"No OTP found for email: {email}")
+        logger.warning("No OTP found for email: %s", email)
         return None
     
     stored_data = otp_storage[email]
     
     # Check if OTP has expired
     if datetime.now() > stored_data["expires_at"]:
-        logger.warning(f"OTP expired for email: {email}")
+        logger.warning("OTP expired for email: %s", email)
         del otp_storage[email]  # Clean up expired OTP
         return None
     
     # Check if OTP matches
     if stored_data["otp"] != otp:
-        logger.warning(f"Invalid OTP for email: {email}")
+        logger.warning("Invalid OTP for email: %s", email)
         return None
     
     # Check if purpose matches
     if stored_data["purpose"] != purpose:
-        logger.warning(f"OTP purpose mismatch for email: {email}. Expected: {purpose}, Got: {stored_data['purpose']}")
+        logger.warning("OTP purpose mismatch for email: %s. Expected: %s, Got: %s", email, purpose, stored_data['purpose'])
         return None
     
     # OTP is valid
     user_id = stored_data["user_id"]
-    logger.info(f"OTP verified successfully for email: {email}, user_id: {user_id}")
+    logger.info("OTP verified successfully for email: %s, user_id: %s", email, user_id)
     
     # Delete OTP after successful verification (single use)
     del otp_storage[email]
@@ -93,7 +93,7 @@ def delete_otp(email: str):
     """Delete OTP for an email address"""
     if email in otp_storage:
         del otp_storage[email]
-        logger.info(f"OTP deleted for email: {email}")
+        logger.info("OTP deleted for email: %s", email)
 
 
 def cleanup_expired_otps():
@@ -105,4 +105,4 @@ def cleanup_expired_otps():
         del otp_storage[email]
     
     if expired_emails:
-        logger.info(f"Cleaned up {len(expired_emails)} expired OTPs")
+        logger.info("Cleaned up %d expired OTPs", len(expired_emails))
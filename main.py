@@ -1,21 +1,24 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import IntegrityError
 from app.database import Base, engine
+from app.core.logging_config import setup_logging
+import logging
 import os
+import pydantic
+import pydantic_core
 
-# import models so they are registered on the metadata
-# import app.models.user  # noqa: F401  # Commented out - using employees table now
-import app.models.employees  # noqa: F401
-import app.models.employee_labels  # noqa: F401
-import app.models.custom_labels  # noqa: F401
-import app.models.products  # noqa: F401
-import app.models.categories  # noqa: F401
-import app.models.business  # noqa: F401
-import app.models.stores  # noqa: F401
-import app.models.payment  # noqa: F401
+# Install the logging queue before the routers are imported, so records logged
+# while they load already go through it
+log_listener = setup_logging()
+
+# import models so they are registered on the metadata; the package imports every model.
+# Importing it by name keeps "app" free for the FastAPI instance below
+from app import models  # noqa: F401
 
 # from app.routes.user import router as users_router  # Commented out - using employees routes now
 from app.routes.employees import router as employees_router
@@ -26,7 +29,39 @@ from app.routes.stores import router as stores_router
 from app.routes.payment import router as payment_router
 from app.routes.custom_labels import router as custom_labels_router
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener.start()
+    logging.info("Validation running on pydantic %s (pydantic-core %s)", pydantic.VERSION, pydantic_core.__version__)
+    yield
+    log_listener.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+# Central fallbacks for errors a route does not handle itself; the request's
+# database session is rolled back when its dependency closes
+@app.exception_handler(IntegrityError)
+async def integrity_error_handler(request: Request, exc: IntegrityError):
+    logging.warning("Constraint violation on %s %s: %s", request.method, request.url.path, exc.orig)
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": "This change conflicts with existing data. Please check for duplicate values."}
+    )
+
+
+# Starlette re-raises the exception after this handler responds and the server
+# logs the traceback, so only a one-line summary is logged here
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logging.error("Unhandled error on %s %s: %r", request.method, request.url.path, exc)
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "An unexpected error occurred. Please try again."}
+    )
+
 
 # Create uploads directory if it doesn't exist
 os.makedirs("uploads/avatars", exist_ok=True)
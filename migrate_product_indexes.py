@@ -0,0 +1,124 @@
+"""
+Migration script to add search indexes to the products table
+Makes barcode unique and adds the per-business lookup/listing indexes, the generated
+search_vector column and the pg_trgm indexes used by /searchProducts
+Duplicate barcodes must be resolved before running it
+Safe to run multiple times - every statement is IF NOT EXISTS
+"""
+
+import os
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from dotenv import load_dotenv
+
+from app.models.products import SEARCH_VECTOR_EXPRESSION
+
+# Load environment variables
+load_dotenv()
+
+# PostgreSQL database configuration
+POSTGRES_USER = os.getenv("POSTGRES_USER", "postgres")
+POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "admin")
+POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
+POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5432")
+POSTGRES_DB = os.getenv("POSTGRES_DB", "supermarket")
+
+# Create PostgreSQL database URL
+DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+
+if not all([POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT, POSTGRES_DB]):
+    raise ValueError("Database configuration not found in environment variables")
+
+# Create engine and session
+engine = create_engine(DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# (description, statement) pairs, applied in order
+MIGRATION_STEPS = [
+    (
+        "drop non-unique barcode index",
+        "DROP INDEX IF EXISTS ix_products_barcode"
+    ),
+    (
+        "unique index on barcode",
+        """
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_products_barcode
+            ON products (barcode)
+        """
+    ),
+    (
+        "composite index on (business_id, id)",
+        """
+            CREATE INDEX IF NOT EXISTS products_business_id_id
+            ON products (business_id, id)
+        """
+    ),
+    (
+        "drop unused (business_id, created_at DESC) index",
+        "DROP INDEX IF EXISTS products_business_created_at"
+    ),
+    (
+        "search_vector generated column",
+        f"""
+            ALTER TABLE products
+            ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED
+        """
+    ),
+    (
+        "GIN index on search_vector",
+        """
+            CREATE INDEX IF NOT EXISTS products_search_vector_gin
+            ON products USING GIN (search_vector)
+        """
+    ),
+    (
+        "pg_trgm extension",
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+    ),
+] + [
+    (
+        f"trigram index on {column}",
+        f"""
+            CREATE INDEX IF NOT EXISTS products_{column}_trgm
+            ON products USING GIN ({column} gin_trgm_ops)
+        """
+    )
+    for column in ("productname", "productid", "barcode", "sku")
+]
+
+def migrate_product_indexes():
+    """Create the product search column and indexes if they are missing"""
+    db = SessionLocal()
+    try:
+        print("Starting product index migration...")
+        
+        for description, statement in MIGRATION_STEPS:
+            print(f"   Applying: {description}")
+            db.execute(text(statement))
+        
+        db.commit()
+        
+        print("✅ Migration completed successfully!")
+        print(f"   Applied {len(MIGRATION_STEPS)} step(s)")
+        
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error during migration: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRODUCT SEARCH INDEX MIGRATION")
+    print("=" * 60)
+    print("This will make barcode unique and add the search_vector column and lookup/search indexes to products")
+    print()
+    
+    confirm = input("Do you want to proceed? (yes/no): ").strip().lower()
+    if confirm == 'yes':
+        migrate_product_indexes()
+        print("\n✅ Migration complete!")
+    else:
+        print("Migration cancelled.")
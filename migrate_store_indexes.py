@@ -0,0 +1,77 @@
+"""
+Migration script to add the store listing index to the stores table
+Adds the (business_id, store_sequence, id) index used by keyset pagination in GET /stores
+Safe to run multiple times - every statement is IF NOT EXISTS
+"""
+
+import os
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# PostgreSQL database configuration
+POSTGRES_USER = os.getenv("POSTGRES_USER", "postgres")
+POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "admin")
+POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
+POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5432")
+POSTGRES_DB = os.getenv("POSTGRES_DB", "supermarket")
+
+# Create PostgreSQL database URL
+DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+
+if not all([POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT, POSTGRES_DB]):
+    raise ValueError("Database configuration not found in environment variables")
+
+# Create engine and session
+engine = create_engine(DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# (description, statement) pairs, applied in order
+MIGRATION_STEPS = [
+    (
+        "composite index on (business_id, store_sequence, id)",
+        """
+            CREATE INDEX IF NOT EXISTS ix_store_biz_seq
+            ON stores (business_id, store_sequence, id)
+        """
+    ),
+]
+
+def migrate_store_indexes():
+    """Create the store listing indexes if they are missing"""
+    db = SessionLocal()
+    try:
+        print("Starting store index migration...")
+        
+        for description, statement in MIGRATION_STEPS:
+            print(f"   Applying: {description}")
+            db.execute(text(statement))
+        
+        db.commit()
+        
+        print("✅ Migration completed successfully!")
+        print(f"   Applied {len(MIGRATION_STEPS)} step(s)")
+        
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error during migration: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("STORE INDEX MIGRATION")
+    print("=" * 60)
+    print("This will add the store listing index to stores")
+    print()
+    
+    confirm = input("Do you want to proceed? (yes/no): ").strip().lower()
+    if confirm == 'yes':
+        migrate_store_indexes()
+        print("\n✅ Migration complete!")
+    else:
+        print("Migration cancelled.")
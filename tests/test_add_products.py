@@ -0,0 +1,229 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import asyncpg
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models.products import Products
+from app.routes import products as products_routes
+from app.routes.products import COPY_THRESHOLD, PRODUCT_INSERT_COLUMNS, add_products, product_copy_records
+from app.schemas.products import ProductBase
+
+OWNER = SimpleNamespace(name="owner", business_key="20000")
+
+# COPY and ON CONFLICT need PostgreSQL; point this at a throwaway asyncpg database to run them
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+requires_postgres = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="set TEST_DATABASE_URL (postgresql+asyncpg://...) to run"
+)
+
+
+def make_products(count, prefix="P"):
+    return [
+        ProductBase(productname=f"Product {i}", barcode=f"{prefix}-BC-{i}", sku=f"{prefix}-SKU-{i}", price=10)
+        for i in range(count)
+    ]
+
+
+class UnusedSession:
+    """Fails the test if add_products reaches the database"""
+
+    async def execute(self, *args, **kwargs):
+        raise AssertionError("add_products should not query the database")
+
+    async def rollback(self):
+        raise AssertionError("add_products should not roll back")
+
+
+@pytest.mark.parametrize("count", [COPY_THRESHOLD - 1, COPY_THRESHOLD])
+def test_add_products_rejects_in_batch_duplicate_barcode_before_inserting(count):
+    products = make_products(count)
+    products[-1] = ProductBase(productname="Copy", barcode=products[0].barcode, price=10)
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(add_products(products, db=UnusedSession(), current_user=OWNER))
+
+    assert excinfo.value.status_code == 400
+    errors = excinfo.value.detail["validation_errors"]
+    assert [(error["product_index"], error["field"]) for error in errors] == [(count - 1, "barcode")]
+
+
+class FailingSecondUploadStorage:
+    """Uploads the first product's images, then fails like a GCS outage"""
+
+    def __init__(self):
+        self.uploads = 0
+        self.deleted = []
+
+    async def upload_product_images_async(self, base64_images, max_images=5):
+        self.uploads += 1
+        if self.uploads > 1:
+            raise Exception("Failed to upload all 1 images. Please check GCS credentials and permissions.")
+        return [f"https://cdn.example.com/products/first-{i}.jpg" for i in range(len(base64_images))]
+
+    def delete_image(self, image_url):
+        self.deleted.append(image_url)
+        return True
+
+
+def test_add_products_removes_earlier_uploads_when_a_later_upload_fails(monkeypatch):
+    storage = FailingSecondUploadStorage()
+    monkeypatch.setattr(products_routes, "storage_service", storage)
+    products = make_products(2)
+    for product in products:
+        product.productimages = ["data:image/jpeg;base64,/9j/4AAQ", "data:image/png;base64,iVBORw0K"]
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(add_products(products, db=UnusedSession(), current_user=OWNER))
+
+    assert excinfo.value.status_code == 500
+    assert excinfo.value.detail["error"] == "ImageUploadError"
+    assert sorted(storage.deleted) == [
+        "https://cdn.example.com/products/first-0.jpg",
+        "https://cdn.example.com/products/first-1.jpg",
+    ]
+
+
+def test_product_copy_records_follow_insert_columns():
+    rows = [
+        {"productname": "Tea", "barcode": "111", "productimages": ["https://cdn.example.com/a.jpg"],
+         "customfields": [{"origin": "Assam"}]},
+        {"productname": "Coffee", "barcode": "222"},
+    ]
+
+    records = product_copy_records(rows)
+
+    assert [record[0] for record in records] == [0, 1]
+    first = dict(zip(PRODUCT_INSERT_COLUMNS, records[0][1:]))
+    assert first["productname"] == "Tea"
+    assert first["productimages"] == '["https://cdn.example.com/a.jpg"]'
+    assert first["customfields"] == '[{"origin": "Assam"}]'
+    second = dict(zip(PRODUCT_INSERT_COLUMNS, records[1][1:]))
+    assert second["productimages"] is None
+    assert second["sku"] is None
+    assert all(len(record) == len(PRODUCT_INSERT_COLUMNS) + 1 for record in records)
+
+
+class FakeCopyConnection:
+    def __init__(self, copy_error=None):
+        self.copy_error = copy_error
+        self.copied = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        if self.copy_error:
+            raise self.copy_error
+        self.copied.extend(records)
+
+
+class CopySession:
+    """Session for the COPY path: temp table statements succeed, the final INSERT can fail"""
+
+    def __init__(self, copy_error=None, insert_error=None):
+        self.driver_connection = FakeCopyConnection(copy_error)
+        self.insert_error = insert_error
+        self.rolled_back = False
+
+    async def execute(self, statement, *args):
+        if str(statement).startswith("INSERT INTO products") and self.insert_error:
+            raise self.insert_error
+
+    async def connection(self):
+        return self
+
+    async def get_raw_connection(self):
+        return self
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+def test_add_products_copy_maps_constraint_errors_like_the_insert_path():
+    not_null = IntegrityError(
+        "INSERT INTO products ...", {},
+        Exception('null value in column "productname" violates not-null constraint'),
+    )
+    db = CopySession(insert_error=not_null)
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(add_products(make_products(COPY_THRESHOLD), db=db, current_user=OWNER))
+
+    assert excinfo.value.status_code == 400
+    assert excinfo.value.detail["error"] == "MissingRequiredFieldError"
+    assert len(db.driver_connection.copied) == COPY_THRESHOLD
+    assert db.rolled_back
+
+
+def test_add_products_copy_wraps_asyncpg_data_errors():
+    too_long = asyncpg.exceptions.StringDataRightTruncationError("value too long for type character varying(100)")
+    db = CopySession(copy_error=too_long)
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(add_products(make_products(COPY_THRESHOLD), db=db, current_user=OWNER))
+
+    assert excinfo.value.status_code == 500
+    assert excinfo.value.detail["error"] == "DatabaseError"
+    assert db.rolled_back
+
+
+async def with_products_table(check):
+    engine = create_async_engine(TEST_DATABASE_URL)
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Products.__table__.create, checkfirst=True)
+            await connection.execute(delete(Products))
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await check(db)
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(delete(Products))
+        await engine.dispose()
+
+
+@requires_postgres
+@pytest.mark.parametrize("count", [COPY_THRESHOLD - 1, COPY_THRESHOLD])
+def test_add_products_inserts_batches_around_copy_threshold(count, monkeypatch):
+    copied = []
+    copy_insert_products = products_routes.copy_insert_products
+
+    async def spy_copy_insert_products(db, product_rows):
+        copied.append(len(product_rows))
+        return await copy_insert_products(db, product_rows)
+
+    monkeypatch.setattr(products_routes, "copy_insert_products", spy_copy_insert_products)
+
+    async def check(db):
+        products = make_products(count)
+        created = await add_products(products, db=db, current_user=OWNER)
+
+        assert [product.barcode for product in created] == [product.barcode for product in products]
+        assert all(product.productid == f"PRD{product.id}" for product in created)
+        stored = (await db.execute(select(Products.productid).where(Products.business_id == "20000"))).scalars().all()
+        assert sorted(stored) == sorted(product.productid for product in created)
+
+    asyncio.run(with_products_table(check))
+    assert copied == ([count] if count >= COPY_THRESHOLD else [])
+
+
+@requires_postgres
+@pytest.mark.parametrize("count", [COPY_THRESHOLD - 1, COPY_THRESHOLD])
+def test_add_products_rolls_back_batch_that_conflicts_with_stored_barcode(count):
+    async def check(db):
+        existing = await add_products(make_products(1, prefix="OLD"), db=db, current_user=OWNER)
+
+        products = make_products(count)
+        products[count // 2] = ProductBase(productname="Clash", barcode=existing[0].barcode, price=10)
+        with pytest.raises(HTTPException) as excinfo:
+            await add_products(products, db=db, current_user=OWNER)
+
+        assert excinfo.value.status_code == 400
+        errors = excinfo.value.detail["validation_errors"]
+        assert [(error["product_index"], error["field"]) for error in errors] == [(count // 2, "barcode")]
+        stored = (await db.execute(select(Products.barcode))).scalars().all()
+        assert stored == [existing[0].barcode]
+
+    asyncio.run(with_products_table(check))
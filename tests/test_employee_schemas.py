@@ -0,0 +1,72 @@
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.employees import (
+    Employee,
+    EmployeeCreate,
+    EmployeePaginatedResponse,
+    format_joining_date,
+    read_joining_date,
+)
+
+EMPLOYEE_ROW = {
+    "emp_id": 1000,
+    "business_id": 20000,
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone_number": "1234567890",
+    "role": "employee",
+}
+
+
+@pytest.mark.parametrize(
+    "stored, expected",
+    [
+        ("15/01/2024", date(2024, 1, 15)),
+        ("2024-01-15", date(2024, 1, 15)),
+        ("15-01-2024", "15-01-2024"),
+        ("31/02/2024", "31/02/2024"),
+        (" 15-01-2024 ", "15-01-2024"),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_read_joining_date_accepts_legacy_values(stored, expected):
+    assert read_joining_date(stored) == expected
+
+
+def test_format_joining_date_passes_strings_through():
+    assert format_joining_date(date(2024, 1, 15)) == "15/01/2024"
+    assert format_joining_date("2024-01-15") == "2024-01-15"
+    assert format_joining_date(None) is None
+
+
+@pytest.mark.parametrize(
+    "stored, expected",
+    [
+        ("2024-01-15", "15/01/2024"),
+        ("15-01-2024", "15-01-2024"),
+        ("31/02/2024", "31/02/2024"),
+    ],
+)
+def test_employee_response_tolerates_legacy_joining_date(stored, expected):
+    employee = Employee(**EMPLOYEE_ROW, joining_date=stored)
+    assert employee.model_dump(mode="json")["joining_date"] == expected
+
+
+def test_employee_list_serializes_legacy_row():
+    # Mirrors GET /employees, which builds items with model_construct
+    items = [
+        Employee.model_construct(**EMPLOYEE_ROW, joining_date=read_joining_date(stored), custom_fields={})
+        for stored in ("15/01/2024", "2024-01-15", "15-01-2024")
+    ]
+    page = EmployeePaginatedResponse.model_construct(items=items, total=3, page=0, page_size=10)
+    dates = [item["joining_date"] for item in page.model_dump(mode="json")["items"]]
+    assert dates == ["15/01/2024", "15/01/2024", "15-01-2024"]
+
+
+def test_employee_create_still_rejects_invalid_joining_date():
+    with pytest.raises(ValidationError):
+        EmployeeCreate(**EMPLOYEE_ROW, password="myPassword123", joining_date="31/02/2024")
@@ -0,0 +1,187 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+
+from app.core.dependencies import get_current_employee_async
+from app.database import get_async_db
+from app.models.products import Products
+from app.routes import products as products_routes
+from app.routes.products import _duplicate_field
+from app.schemas.products import ProductResponse, ProductUpdate
+
+
+def integrity_error(message: str) -> IntegrityError:
+    return IntegrityError("UPDATE products ...", {}, Exception(message))
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        (
+            'duplicate key value violates unique constraint "ix_products_barcode"\n'
+            "DETAIL:  Key (barcode)=(8901234567890) already exists.",
+            "barcode",
+        ),
+        (
+            'duplicate key value violates unique constraint "ix_products_sku"\n'
+            "DETAIL:  Key (sku)=(barcode-kit) already exists.",
+            "sku",
+        ),
+        ('null value in column "productname" violates not-null constraint', None),
+        ('duplicate key value violates unique constraint "ix_products_productid"', None),
+    ],
+)
+def test_duplicate_field_names_the_violated_column(message, expected):
+    assert _duplicate_field(integrity_error(message)) == expected
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    """Just enough of AsyncSession for update_product, which loads one product and commits"""
+
+    def __init__(self, product, commit_error=None):
+        self.product = product
+        self.commit_error = commit_error
+        self.committed = False
+        self.rolled_back = False
+
+    async def execute(self, statement):
+        return FakeResult(self.product)
+
+    async def commit(self):
+        if self.commit_error:
+            raise self.commit_error
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+    async def refresh(self, instance):
+        pass
+
+
+class FakeStorage:
+    def __init__(self, upload_error=None):
+        self.upload_error = upload_error
+        self.deleted = []
+
+    async def upload_product_images_async(self, base64_images, max_images=5):
+        if self.upload_error:
+            raise self.upload_error
+        return [f"https://cdn.example.com/products/new-{i}.jpg" for i in range(len(base64_images))]
+
+    def delete_image(self, image_url):
+        self.deleted.append(image_url)
+        return True
+
+
+OWNER = SimpleNamespace(name="owner", business_key="20000")
+EXISTING_URL = "https://cdn.example.com/products/old.jpg"
+NEW_IMAGE = "data:image/jpeg;base64,/9j/4AAQ"
+
+
+def stored_product():
+    return Products(
+        id=7, business_id="20000", productid="PRD7", productname="Tea", barcode="111",
+        sku="TEA-1", price=10, productimages=[EXISTING_URL],
+    )
+
+
+def run_update(db, **fields):
+    return asyncio.run(products_routes.update_product(7, ProductUpdate(**fields), db=db, current_user=OWNER))
+
+
+def test_update_product_saves_uploaded_image_urls(monkeypatch):
+    storage = FakeStorage()
+    monkeypatch.setattr(products_routes, "storage_service", storage)
+    db = FakeSession(stored_product())
+
+    response = run_update(db, productimages=[EXISTING_URL, NEW_IMAGE])
+
+    assert db.committed
+    assert response.productimages == [EXISTING_URL, "https://cdn.example.com/products/new-0.jpg"]
+    assert storage.deleted == []
+
+
+def test_update_product_reports_failed_uploads_before_saving(monkeypatch):
+    upload_error = Exception("Failed to upload all 1 images. Please check GCS credentials and permissions.")
+    monkeypatch.setattr(products_routes, "storage_service", FakeStorage(upload_error=upload_error))
+    product = stored_product()
+    db = FakeSession(product)
+
+    with pytest.raises(HTTPException) as excinfo:
+        run_update(db, productname="Green tea", productimages=[NEW_IMAGE])
+
+    assert excinfo.value.status_code == 500
+    assert excinfo.value.detail["error"] == "ImageUploadError"
+    assert not db.committed
+    assert product.productname == "Tea"
+
+
+def test_update_product_maps_duplicate_barcode_and_removes_uploads(monkeypatch):
+    storage = FakeStorage()
+    monkeypatch.setattr(products_routes, "storage_service", storage)
+    duplicate = integrity_error(
+        'duplicate key value violates unique constraint "ix_products_barcode"\n'
+        "DETAIL:  Key (barcode)=(222) already exists."
+    )
+    db = FakeSession(stored_product(), commit_error=duplicate)
+
+    with pytest.raises(HTTPException) as excinfo:
+        run_update(db, barcode="222", productimages=[NEW_IMAGE])
+
+    assert excinfo.value.status_code == 400
+    assert excinfo.value.detail["field"] == "barcode"
+    assert db.rolled_back
+    assert storage.deleted == ["https://cdn.example.com/products/new-0.jpg"]
+
+
+class ListSession:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def scalar(self, statement):
+        return len(self.rows)
+
+    async def execute(self, statement):
+        return self.rows
+
+
+def product_row(**overrides):
+    row = {field: None for field in ProductResponse.model_fields}
+    row.update(
+        id=7, productid="PRD7", productname="Tea", barcode="111", price=Decimal("12.50"),
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc), updated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+def test_get_products_sends_price_as_a_json_number():
+    app = FastAPI()
+    app.include_router(products_routes.router)
+    app.dependency_overrides[get_async_db] = lambda: ListSession([product_row()])
+    app.dependency_overrides[get_current_employee_async] = lambda: OWNER
+
+    body = TestClient(app).get("/getProducts").json()
+
+    assert body["total"] == 1
+    assert body["items"][0]["price"] == 12.5
+
+
+def test_other_product_responses_keep_price_as_a_string():
+    assert json.loads(products_routes.product_response(product_row()).model_dump_json())["price"] == "12.50"
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.stores import Store
+from app.routes import stores as stores_routes
+
+OWNER = SimpleNamespace(name="owner", emp_id=1000, business_key="20000")
+NO_CONDITIONAL_HEADERS = SimpleNamespace(headers={})
+CREATED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+EDITED = datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def one_or_none(self):
+        return self.row
+
+
+class FakeSession:
+    """Serves one stored row: the version query through execute, the full store through scalar"""
+
+    def __init__(self, store):
+        self.store = store
+
+    async def execute(self, statement):
+        if self.store is None:
+            return FakeResult(None)
+        return FakeResult(SimpleNamespace(updated_at=self.store.updated_at, created_at=self.store.created_at))
+
+    async def scalar(self, statement):
+        return self.store
+
+
+def store_row(name, updated_at=None):
+    return Store(
+        id=5, business_id="20000", store_sequence=1, store_name=name,
+        created_at=CREATED, updated_at=updated_at,
+    )
+
+
+def get_store(db):
+    response = asyncio.run(stores_routes.get_store(5, NO_CONDITIONAL_HEADERS, db=db, current_user=OWNER))
+    return json.loads(response.body)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    stores_routes.store_response_cache.clear()
+    yield
+    stores_routes.store_response_cache.clear()
+
+
+def test_get_store_serves_cached_body_while_unchanged():
+    assert get_store(FakeSession(store_row("Main")))["store_name"] == "Main"
+
+    # Same version: the cached body is served without loading the store again
+    unchanged = FakeSession(store_row("Renamed elsewhere"))
+    assert get_store(unchanged)["store_name"] == "Main"
+
+
+def test_get_store_reloads_after_another_worker_updates_it():
+    get_store(FakeSession(store_row("Main")))
+
+    assert get_store(FakeSession(store_row("Downtown", updated_at=EDITED)))["store_name"] == "Downtown"
+
+
+def test_get_store_does_not_serve_a_deleted_store_from_cache():
+    get_store(FakeSession(store_row("Main")))
+
+    with pytest.raises(HTTPException) as excinfo:
+        get_store(FakeSession(None))
+    assert excinfo.value.status_code == 404
+    assert stores_routes.store_response_cache == {}